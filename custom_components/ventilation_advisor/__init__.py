@@ -4,15 +4,71 @@
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_ROOMS
+from .const import (
+    CONF_COMPACT_MODE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    DEFAULT_COMPACT_MODE,
+    DOMAIN,
+    METRIC_AIR_CHANGE_RATE,
+    METRIC_CONDENSATION_MARGIN,
+    METRIC_DRYING_POTENTIAL,
+    METRIC_EFFICIENCY,
+    METRIC_INDOOR_AH,
+    METRIC_LAST_SESSION,
+    METRIC_MOISTURE_EVENT,
+    METRIC_MOULD_RISK,
+    METRIC_TREND,
+    METRIC_VOLUME,
+    METRIC_WATER_CONTENT,
+    STORAGE_VERSION,
+)
+from .coordinator import VentilationCoordinator
+from .data import VentilationData
+from .room_config import room_metrics
+from .services import async_setup_services
+from .websocket import async_setup_websocket
 
 PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
     Platform.SENSOR,
     Platform.SELECT,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Unique id suffixes of the per-metric room entities ("<entry_id>_<room_id>_<suffix>").
+_METRIC_SUFFIXES = {
+    METRIC_INDOOR_AH: ("indoor_ah",),
+    METRIC_WATER_CONTENT: ("water_ml",),
+    METRIC_MOULD_RISK: ("mould_risk",),
+    METRIC_DRYING_POTENTIAL: ("drying_power",),
+    METRIC_EFFICIENCY: ("efficiency",),
+    METRIC_VOLUME: ("volume",),
+    METRIC_AIR_CHANGE_RATE: ("air_change_rate",),
+    METRIC_LAST_SESSION: ("session_water", "session_temp_drop"),
+    METRIC_TREND: ("humidity_trend", "water_trend"),
+    METRIC_MOISTURE_EVENT: ("moisture_event",),
+    METRIC_CONDENSATION_MARGIN: ("condensation_margin",),
+}
+_ROOM_SUFFIXES = (
+    "master_advice",
+    "strategy",
+    *(suffix for suffixes in _METRIC_SUFFIXES.values() for suffix in suffixes),
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register service actions and the websocket API once for all entries."""
+    await async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
@@ -20,17 +76,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if CONF_ROOMS not in entry.options:
         hass.config_entries.async_update_entry(entry, options={CONF_ROOMS: []})
 
+    coordinator = VentilationCoordinator(hass, entry)
+    await coordinator.async_load()
+    entry.runtime_data = VentilationData(coordinator=coordinator)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _async_remove_stale_entities(hass, entry)
+    coordinator.async_setup()
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+@callback
+def _async_remove_stale_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop registry entries of removed rooms or metrics hidden by compact mode.
+
+    Only room entities whose removal follows from the options are touched, so entities of a
+    platform that failed to set up, or of unknown origin, are kept.
+    """
+    compact = entry.options.get(CONF_COMPACT_MODE, DEFAULT_COMPACT_MODE)
+    wanted: dict[str, set[str]] = {}
+    for room in entry.options.get(CONF_ROOMS, []):
+        suffixes = wanted[str(room.get("id", room[CONF_ROOM_NAME]))] = {"master_advice"}
+        if not compact:
+            suffixes.add("strategy")
+        for metric in room_metrics(room, compact):
+            suffixes.update(_METRIC_SUFFIXES[metric])
+
+    registry = er.async_get(hass)
+    expected = entry.runtime_data.unique_ids
+    prefix = f"{entry.entry_id}_"
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        unique_id = entity_entry.unique_id
+        if unique_id in expected or not unique_id.startswith(prefix):
+            continue
+        for suffix in _ROOM_SUFFIXES:
+            if not unique_id.endswith(f"_{suffix}"):
+                continue
+            room_id = unique_id[len(prefix) : -len(suffix) - 1]
+            if room_id in ("", "global"):
+                break
+            if room_id not in wanted or suffix not in wanted[room_id]:
+                registry.async_remove(entity_entry.entity_id)
+            break
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
+    # Flush learned state so a reload does not load the file before the delayed save runs.
+    await entry.runtime_data.coordinator.async_save()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove learned state when the entry is deleted."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,189 @@
+"""Closed-loop control of fans, dehumidifiers and switches that follow the room results."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.humidifier import HumidifierDeviceClass
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    ACTUATION_INTERVAL,
+    ACTUATION_MAX_PER_BATCH,
+    CONF_ACTUATORS,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    DEFAULT_MIN_OFF_TIME,
+    DEFAULT_MIN_ON_TIME,
+    DEHUMIDIFY_START_RISK,
+    DEHUMIDIFY_STOP_RISK,
+    LOGGER,
+)
+from .data import Advice, RoomResult
+
+if TYPE_CHECKING:
+    from .coordinator import VentilationCoordinator
+
+HUMIDIFIER_DOMAIN = "humidifier"
+
+
+def needs_ventilation(result: RoomResult, _running: bool) -> bool | None:
+    """Fans and switches run while the advice recommends ventilating; None leaves them as they are."""
+    if result.advice is Advice.UNKNOWN:
+        return None
+    return result.advice.recommends_ventilation
+
+
+def needs_drying(result: RoomResult, running: bool) -> bool | None:
+    """Dehumidifiers run during a moisture event and on mould risk, with hysteresis on the risk.
+
+    A stopped dehumidifier starts at `DEHUMIDIFY_START_RISK`, or above `DEHUMIDIFY_STOP_RISK` when
+    outdoor air cannot dry the room; a running one keeps going until the risk falls to the stop level.
+    """
+    if result.mould_risk is None:
+        return None
+    if result.moisture_event:
+        return True
+    if running:
+        return result.mould_risk > DEHUMIDIFY_STOP_RISK
+    return result.mould_risk >= DEHUMIDIFY_START_RISK or (
+        result.mould_risk > DEHUMIDIFY_STOP_RISK
+        and result.drying_potential is not None
+        and result.drying_potential <= 0
+    )
+
+
+def is_dehumidifier(hass: HomeAssistant, entity_id: str) -> bool:
+    """Return whether a humidifier entity dries the air, from its registry entry or its state."""
+    entry = er.async_get(hass).async_get(entity_id)
+    if entry is not None and (device_class := entry.device_class or entry.original_device_class):
+        return device_class == HumidifierDeviceClass.DEHUMIDIFIER
+    state = hass.states.get(entity_id)
+    return state is not None and state.attributes.get(ATTR_DEVICE_CLASS) == HumidifierDeviceClass.DEHUMIDIFIER
+
+
+class ActuationController:
+    """Switch each room's actuators with its result, batched and rate-limited across all rooms.
+
+    Fans and switches follow the ventilation advice; dehumidifiers follow the room's drying need.
+    Humidifiers that add moisture are never switched. Result changes only update the desired state.
+    A periodic flush compares it with each actuator's current state and sends at most
+    `ACTUATION_MAX_PER_BATCH` commands as one `homeassistant.turn_on` and one `turn_off` call,
+    skipping actuators that have not yet been on or off for their room's minimum time.
+    A command is repeated on later flushes until the actuator reports the desired state, so failed
+    or dropped calls are retried. After that, manual switching is not overridden until the desired
+    state changes again.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: VentilationCoordinator) -> None:
+        """Initialize the controller from the rooms' actuator options."""
+        self.hass = hass
+        self._coordinator = coordinator
+        # entity_id -> (min on seconds, min off seconds)
+        self._min_times: dict[str, tuple[float, float]] = {}
+        self._room_actuators: dict[str, list[str]] = {}
+        for room_id, room in coordinator.rooms.items():
+            for entity_id in room.get(CONF_ACTUATORS, []):
+                self._min_times[entity_id] = (
+                    room.get(CONF_MIN_ON_TIME, DEFAULT_MIN_ON_TIME) * 60,
+                    room.get(CONF_MIN_OFF_TIME, DEFAULT_MIN_OFF_TIME) * 60,
+                )
+                self._room_actuators.setdefault(room_id, []).append(entity_id)
+        self.desired: dict[str, bool] = {}
+        # Actuators whose desired state has not been reported back yet.
+        self.pending: set[str] = set()
+        self._ignored: set[str] = set()
+        self._flushing = False
+
+    @callback
+    def async_setup(self) -> None:
+        """Start following evaluation passes and flushing commands."""
+        entry = self._coordinator.entry
+        entry.async_on_unload(self._coordinator.async_add_cycle_listener(self._async_cycle))
+        entry.async_on_unload(
+            async_track_time_interval(self.hass, self._async_flush, timedelta(seconds=ACTUATION_INTERVAL))
+        )
+
+    def _is_on(self, entity_id: str) -> bool | None:
+        """Return the actuator's current state, or None while it is unavailable or unknown."""
+        if (state := self.hass.states.get(entity_id)) is None or state.state not in (STATE_ON, STATE_OFF):
+            return None
+        return state.state == STATE_ON
+
+    def _rule(self, entity_id: str) -> Callable[[RoomResult, bool], bool | None] | None:
+        if split_entity_id(entity_id)[0] != HUMIDIFIER_DOMAIN:
+            return needs_ventilation
+        if is_dehumidifier(self.hass, entity_id):
+            return needs_drying
+        if entity_id not in self._ignored:
+            self._ignored.add(entity_id)
+            LOGGER.warning("%s is not a dehumidifier and is not switched by the room advice", entity_id)
+        return None
+
+    @callback
+    def _async_cycle(self, changed: set[str] | None, _outdoor: bool) -> None:
+        if not changed:
+            return
+        for room_id in changed:
+            if (actuators := self._room_actuators.get(room_id)) is None:
+                continue
+            result = self._coordinator.results[room_id]
+            for entity_id in actuators:
+                if (rule := self._rule(entity_id)) is None:
+                    continue
+                running = self._is_on(entity_id)
+                if running is None:
+                    running = self.desired.get(entity_id, False)
+                # None: the sources are unavailable; leave the actuator as it is.
+                if (wanted := rule(result, running)) is not None and wanted != self.desired.get(entity_id):
+                    self.desired[entity_id] = wanted
+                    self.pending.add(entity_id)
+
+    async def _async_flush(self, now: datetime) -> None:
+        if self._flushing:
+            return
+        timestamp = now.timestamp()
+        turn_on: list[str] = []
+        turn_off: list[str] = []
+        for entity_id in sorted(self.pending):
+            if (state := self.hass.states.get(entity_id)) is None or (is_on := self._is_on(entity_id)) is None:
+                continue
+            wanted = self.desired[entity_id]
+            if wanted == is_on:
+                self.pending.discard(entity_id)
+                continue
+            min_on, min_off = self._min_times[entity_id]
+            if timestamp - state.last_changed.timestamp() < (min_on if is_on else min_off):
+                continue
+            (turn_on if wanted else turn_off).append(entity_id)
+            if len(turn_on) + len(turn_off) >= ACTUATION_MAX_PER_BATCH:
+                break
+
+        self._flushing = True
+        try:
+            for service, entity_ids in ((SERVICE_TURN_ON, turn_on), (SERVICE_TURN_OFF, turn_off)):
+                if not entity_ids:
+                    continue
+                LOGGER.debug("Calling homeassistant.%s for %s", service, entity_ids)
+                try:
+                    await self.hass.services.async_call(
+                        "homeassistant", service, {ATTR_ENTITY_ID: entity_ids}, blocking=True
+                    )
+                except HomeAssistantError as err:
+                    # The actuators stay pending and are retried on the next flush.
+                    LOGGER.warning("Calling homeassistant.%s for %s failed: %s", service, entity_ids, err)
+        finally:
+            self._flushing = False
@@ -0,0 +1,161 @@
+"""Air change rate estimation from CO2 decay after ventilation starts."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import math
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    AIR_CHANGE_END_RISE,
+    AIR_CHANGE_END_SAMPLES,
+    AIR_CHANGE_MIN_DROP,
+    AIR_CHANGE_MIN_DURATION,
+    AIR_CHANGE_MIN_EXCESS,
+    AIR_CHANGE_MIN_R2,
+    AIR_CHANGE_SMOOTHING,
+    AIR_CHANGE_WINDOW,
+    CO2_OUTDOOR_BASELINE,
+)
+
+
+class DecayFit:
+    """Running least-squares fit of ln(C - baseline) = a - k·t, updated in O(1) per sample."""
+
+    __slots__ = ("n", "s_t", "s_tt", "s_ty", "s_y", "s_yy")
+
+    def __init__(self) -> None:
+        """Initialize an empty fit."""
+        self.n = 0
+        self.s_t = self.s_y = self.s_tt = self.s_ty = self.s_yy = 0.0
+
+    def add(self, hours: float, excess: float) -> None:
+        """Add a sample taken `hours` after the peak with `excess` ppm above the baseline."""
+        y = math.log(excess)
+        self.n += 1
+        self.s_t += hours
+        self.s_y += y
+        self.s_tt += hours * hours
+        self.s_ty += hours * y
+        self.s_yy += y * y
+
+    def result(self) -> tuple[float, float] | None:
+        """Return (k per hour, R²), or None while the fit is undetermined."""
+        n = self.n
+        if n < 3:
+            return None
+        var_t = n * self.s_tt - self.s_t * self.s_t
+        var_y = n * self.s_yy - self.s_y * self.s_y
+        if var_t <= 0 or var_y <= 0:
+            return None
+
+        cov = n * self.s_ty - self.s_t * self.s_y
+        slope = cov / var_t
+        r2 = (cov * cov) / (var_t * var_y)
+        return -slope, r2
+
+
+class AirChangeEstimator:
+    """Detect CO2 decay episodes and learn the room's air change rate from a running fit."""
+
+    def __init__(self, baseline: float = CO2_OUTDOOR_BASELINE) -> None:
+        """Initialize the estimator."""
+        self.baseline = baseline
+        self.learned_ach: float | None = None
+        self.last_episode_ach: float | None = None
+        self.last_episode: datetime | None = None
+        self.episodes = 0
+        # Current episode: peak as (timestamp, ppm), lowest level, last fitted sample time and the fit itself.
+        self._peak: tuple[float, float] | None = None
+        self._minimum = 0.0
+        self._last = 0.0
+        self._fit = DecayFit()
+        # Samples above the minimum that may end the episode, held back from the fit until confirmed.
+        self._rising: list[tuple[float, float]] = []
+
+    def add_sample(self, ppm: float, when: datetime) -> bool:
+        """Add a CO2 sample; return True when a decay episode updated the learned rate."""
+        timestamp = when.timestamp()
+        peak = self._peak
+
+        if peak is None:
+            self._restart(timestamp, ppm)
+            return False
+
+        if ppm > peak[1]:
+            # New peak: the previous decay is over and a possible new one starts from here.
+            updated = self._finish_episode(when)
+            self._restart(timestamp, ppm)
+            return updated
+
+        if ppm - self.baseline >= AIR_CHANGE_MIN_EXCESS and self._fit.n < AIR_CHANGE_WINDOW:
+            if ppm < self._minimum + AIR_CHANGE_END_RISE:
+                # Still decaying: a short rise was sensor noise and belongs to the fit.
+                for sample in self._rising:
+                    self._add(*sample)
+                self._rising.clear()
+                self._add(timestamp, ppm)
+                return False
+            self._rising.append((timestamp, ppm))
+            if len(self._rising) < AIR_CHANGE_END_SAMPLES:
+                return False
+
+        updated = self._finish_episode(when)
+        self._restart(timestamp, ppm)
+        return updated
+
+    def _add(self, timestamp: float, ppm: float) -> None:
+        assert self._peak is not None
+        self._fit.add((timestamp - self._peak[0]) / 3600, ppm - self.baseline)
+        self._minimum = min(self._minimum, ppm)
+        self._last = timestamp
+
+    def _restart(self, timestamp: float, ppm: float) -> None:
+        self._peak = (timestamp, ppm)
+        self._minimum = ppm
+        self._last = timestamp
+        self._fit = DecayFit()
+        self._rising.clear()
+        if ppm - self.baseline >= AIR_CHANGE_MIN_EXCESS:
+            self._fit.add(0.0, ppm - self.baseline)
+
+    def _finish_episode(self, when: datetime) -> bool:
+        assert self._peak is not None
+        start, peak = self._peak
+        if peak - self._minimum < AIR_CHANGE_MIN_DROP:
+            return False
+        if self._last - start < AIR_CHANGE_MIN_DURATION:
+            return False
+        if (fit := self._fit.result()) is None:
+            return False
+
+        ach, r2 = fit
+        if ach <= 0 or r2 < AIR_CHANGE_MIN_R2:
+            return False
+
+        self.last_episode_ach = round(ach, 2)
+        self.last_episode = when
+        self.episodes += 1
+        if self.learned_ach is None:
+            self.learned_ach = self.last_episode_ach
+        else:
+            self.learned_ach = round(self.learned_ach + AIR_CHANGE_SMOOTHING * (ach - self.learned_ach), 2)
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned state for storage."""
+        return {
+            "learned_ach": self.learned_ach,
+            "last_episode_ach": self.last_episode_ach,
+            "last_episode": self.last_episode.isoformat() if self.last_episode else None,
+            "episodes": self.episodes,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the learned state from storage."""
+        self.learned_ach = data.get("learned_ach")
+        self.last_episode_ach = data.get("last_episode_ach")
+        self.last_episode = dt_util.parse_datetime(data["last_episode"]) if data.get("last_episode") else None
+        self.episodes = data.get("episodes", 0)
@@ -0,0 +1,80 @@
+"""Binary sensor platform for Ventilation Advisor."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_AREA_ID,
+    CONF_COMPACT_MODE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    DEFAULT_COMPACT_MODE,
+    DOMAIN,
+    METRIC_MOISTURE_EVENT,
+)
+from .room_config import room_metrics
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor platform."""
+    compact = entry.options.get(CONF_COMPACT_MODE, DEFAULT_COMPACT_MODE)
+    entities = [
+        MoistureEventBinarySensor(entry, room)
+        for room in entry.options.get(CONF_ROOMS, [])
+        if METRIC_MOISTURE_EVENT in room_metrics(room, compact)
+    ]
+
+    entry.runtime_data.unique_ids.update(entity.unique_id for entity in entities)
+    async_add_entities(entities)
+
+
+class MoistureEventBinarySensor(BinarySensorEntity):
+    """On while a sharp humidity rise (shower, cooking) is detected in the room."""
+
+    _attr_should_poll = False
+    _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _attr_icon = "mdi:shower-head"
+
+    def __init__(self, entry: ConfigEntry, room: dict) -> None:
+        """Initialize moisture event sensor."""
+        self._room = room
+        self._room_id = room.get("id", room[CONF_ROOM_NAME])
+        self._coordinator = entry.runtime_data.coordinator
+        self._detector = self._coordinator.moisture[self._room_id]
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Moisture Event"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_moisture_event"
+
+    async def async_added_to_hass(self):
+        """Register with the coordinator; states are written after each evaluation pass."""
+        self.async_on_remove(self._coordinator.async_add_listener(self._room_id, self))
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        info = {
+            "identifiers": {(DOMAIN, self._room_id)},
+            "name": self._room[CONF_ROOM_NAME],
+            "manufacturer": "Ventilation Advisor",
+            "model": "Room Advisor",
+        }
+        if area_id := self._room.get(CONF_AREA_ID):
+            info["suggested_area"] = area_id
+        return info
+
+    @property
+    def is_on(self):
+        """Return True while a moisture event is active."""
+        return self._detector.active
+
+    @property
+    def extra_state_attributes(self):
+        """Return the water added by the current or last event (g)."""
+        return {"added_water": self._detector.added_water}
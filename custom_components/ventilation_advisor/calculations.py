@@ -0,0 +1,278 @@
+"""Pure room calculations for Ventilation Advisor."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+
+from .const import (
+    CO2_CRITICAL,
+    CO2_WARN,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_CRITICAL_OVERRIDE,
+    CONF_CO2_WARN_OVERRIDE,
+    CONF_FLOOR_AREA,
+    CONF_HAS_SLOPE,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    CONF_SLOPE_A,
+    CONF_SLOPE_B,
+    CONF_SLOPE_C,
+    MAGNUS_A,
+    MAGNUS_B,
+    MAGNUS_C,
+    MAGNUS_K,
+    MOULD_RISK_CRITICAL,
+    MOULD_RISK_SAFE,
+    STRATEGY_AGGRESSIVE,
+    STRATEGY_ENERGY_SAVER,
+    STRATEGY_FRESH_AIR,
+    SURFACE_MOULD_CRITICAL,
+    SURFACE_MOULD_SAFE,
+    TREND_RISING_AH,
+)
+from .data import Advice, Efficiency, RoomResult
+
+
+def calculate_absolute_humidity(temperature: float, humidity: float) -> float:
+    """Calculate absolute humidity in g/m³ using the Magnus Formula."""
+    t = temperature
+    rh = humidity
+
+    # Saturation Vapor Pressure (hPa)
+    if (t + MAGNUS_C) == 0:
+        return 0.0
+
+    p_sat = MAGNUS_A * math.exp((MAGNUS_B * t) / (t + MAGNUS_C))
+
+    # Actual Vapor Pressure (hPa)
+    p_act = p_sat * (rh / 100.0)
+
+    # Absolute Humidity (g/m³)
+    ah = 216.7 * (p_act / (MAGNUS_K + t))
+
+    return round(ah, 2)
+
+
+def calculate_dew_point(temperature: float, humidity: float) -> float | None:
+    """Calculate the dew point in °C with the closed-form inverse of the Magnus formula."""
+    if humidity <= 0 or (temperature + MAGNUS_C) == 0:
+        return None
+    gamma = math.log(humidity / 100.0) + (MAGNUS_B * temperature) / (temperature + MAGNUS_C)
+    return MAGNUS_C * gamma / (MAGNUS_B - gamma)
+
+
+def calculate_surface_humidity(temperature: float, humidity: float, surface_temperature: float) -> float:
+    """Relative humidity (%) of the room air when cooled to a surface's temperature, capped at 100."""
+    if (surface_temperature + MAGNUS_C) == 0 or (temperature + MAGNUS_C) == 0:
+        return 100.0
+    exponent = MAGNUS_B * temperature / (temperature + MAGNUS_C) - MAGNUS_B * surface_temperature / (
+        surface_temperature + MAGNUS_C
+    )
+    return min(100.0, humidity * math.exp(exponent))
+
+
+def calculate_room_volume(room: dict) -> float:
+    """Return the effective air volume of a room in m³."""
+    volume = room[CONF_FLOOR_AREA] * room[CONF_CEILING_HEIGHT]
+
+    # Substract sloping roof volume if configured
+    if room.get(CONF_HAS_SLOPE):
+        v_slope = 0.5 * room.get(CONF_SLOPE_A, 0) * room.get(CONF_SLOPE_B, 0) * room.get(CONF_SLOPE_C, 0)
+        volume = max(0, volume - v_slope)
+
+    return volume
+
+
+@dataclass(frozen=True, slots=True)
+class RoomRules:
+    """Decision rules of one room, compiled once from its strategy and threshold overrides."""
+
+    volume: float
+    mould_safe: float
+    mould_critical: float
+    mould_scale: float
+    mode: int
+    co2_warn: float
+    co2_critical: float
+    risk_threshold: float
+    power_threshold: float
+    rise_threshold: float | None = None
+
+
+# Strategy modes of the compiled advice rules
+MODE_STANDARD = 0
+MODE_ENERGY_SAVER = 1
+MODE_AGGRESSIVE = 2
+
+
+def compile_room_rules(room: dict, strategy: str, trend_advice: bool = False) -> RoomRules:
+    """Resolve strategy and overrides of a room into plain numbers."""
+    safe = room.get(CONF_MOULD_SAFE_OVERRIDE, MOULD_RISK_SAFE)
+    critical = room.get(CONF_MOULD_CRITICAL_OVERRIDE, MOULD_RISK_CRITICAL)
+    is_fresh_air_lover = strategy == STRATEGY_FRESH_AIR
+
+    if strategy == STRATEGY_ENERGY_SAVER:
+        mode = MODE_ENERGY_SAVER
+    elif strategy == STRATEGY_AGGRESSIVE:
+        mode = MODE_AGGRESSIVE
+    else:
+        mode = MODE_STANDARD
+
+    return RoomRules(
+        volume=calculate_room_volume(room),
+        mould_safe=safe,
+        mould_critical=critical,
+        mould_scale=100 / (critical - safe) if critical != safe else 0.0,
+        mode=mode,
+        co2_warn=room.get(CONF_CO2_WARN_OVERRIDE, CO2_WARN),
+        co2_critical=room.get(CONF_CO2_CRITICAL_OVERRIDE, CO2_CRITICAL),
+        risk_threshold=30 if is_fresh_air_lover else 50,
+        power_threshold=1.0 if is_fresh_air_lover else 2.0,
+        rise_threshold=TREND_RISING_AH if trend_advice else None,
+    )
+
+
+def calculate_mould_risk(rules: RoomRules, humidity: float) -> float:
+    """Map relative humidity onto a 0-100% mould risk score."""
+    if humidity < rules.mould_safe:
+        return 0.0
+    if humidity >= rules.mould_critical:
+        return 100.0
+    return round((humidity - rules.mould_safe) * rules.mould_scale, 0)
+
+
+def calculate_surface_mould_risk(surface_humidity: float) -> float:
+    """Map the relative humidity at a surface onto a 0-100% mould risk score (70-80% criterion)."""
+    risk = (surface_humidity - SURFACE_MOULD_SAFE) * 100 / (SURFACE_MOULD_CRITICAL - SURFACE_MOULD_SAFE)
+    return round(min(max(risk, 0.0), 100.0), 0)
+
+
+def calculate_efficiency(dp: float, i_t: float, i_h: float, o_t: float) -> Efficiency:
+    """Classify how much drying (AH delta `dp`) is gained per degree of heat lost."""
+    if dp <= 0:
+        return Efficiency.COUNTER_PRODUCTIVE
+
+    dt = i_t - o_t
+    if dt <= 0:
+        return Efficiency.HIGH_FREE_COOLING
+
+    penalty_factor = 1.0
+    if i_h > 40:
+        penalty_factor = 1 + ((i_h - 40) * 0.005)
+
+    ratio = dp / (dt * penalty_factor)
+    if ratio > 0.3:
+        return Efficiency.HIGH
+    if ratio > 0.1:
+        return Efficiency.MEDIUM
+    return Efficiency.LOW
+
+
+def decide_advice(rules: RoomRules, risk: float, power: float, eff: Efficiency, co2: float | None) -> Advice:
+    """Combine risk, drying potential, efficiency and CO2 into one advice."""
+    if risk >= 80:
+        return Advice.URGENT_MOULD
+
+    if co2 is not None and co2 >= rules.co2_critical:
+        return Advice.URGENT_AIR_QUALITY
+
+    if power <= 0:
+        if co2 and co2 >= rules.co2_warn:
+            return Advice.RECOMMENDED_FRESH_AIR
+        return Advice.HOLD_INEFFECTIVE
+
+    if rules.mode == MODE_ENERGY_SAVER:
+        return Advice.OPTIONAL_EFFICIENT if eff >= Efficiency.HIGH else Advice.HOLD_ECO
+
+    if rules.mode == MODE_AGGRESSIVE:
+        return Advice.RECOMMENDED_DRYING
+
+    if risk > rules.risk_threshold:
+        return Advice.RECOMMENDED
+    if power > rules.power_threshold:
+        return Advice.RECOMMENDED_QUICK
+    if eff >= Efficiency.HIGH:
+        return Advice.OPTIONAL_EFFICIENT
+
+    return Advice.HOLD_LOW_NECESSITY
+
+
+def apply_humidity_trend(rules: RoomRules, result: RoomResult, slope: float | None) -> None:
+    """Add the absolute humidity trend (g/m³ per hour) to a result and flag rapidly rising rooms."""
+    if slope is None:
+        return
+    result.humidity_trend = round(slope, 2)
+    # 1 g of water is 1 ml, so g/m³ per hour times the volume gives ml per hour.
+    result.water_trend = round(slope * rules.volume, 0)
+
+    if (
+        rules.rise_threshold is not None
+        and slope >= rules.rise_threshold
+        and not result.advice.recommends_ventilation
+        and result.drying_potential is not None
+        and result.drying_potential > 0
+    ):
+        result.advice = Advice.RECOMMENDED_RISING
+
+
+def apply_moisture_event(result: RoomResult, active: bool) -> None:
+    """Escalate the advice while a moisture event is active and outdoor air can dry the room."""
+    result.moisture_event = active
+    if (
+        active
+        and result.advice not in (Advice.URGENT_MOULD, Advice.URGENT_AIR_QUALITY)
+        and result.drying_potential is not None
+        and result.drying_potential > 0
+    ):
+        result.advice = Advice.URGENT_MOISTURE
+
+
+def evaluate_room(
+    rules: RoomRules,
+    i_t: float | None,
+    i_h: float | None,
+    o_t: float | None,
+    o_h: float | None,
+    *,
+    co2: float | None = None,
+    surfaces: Sequence[float | None] = (),
+) -> RoomResult:
+    """Evaluate every derived metric of a room from its current source values.
+
+    With surface temperatures, the coldest surface's humidity also feeds the mould risk.
+    """
+    result = RoomResult(volume=round(rules.volume, 2))
+
+    if i_h is not None:
+        result.mould_risk = calculate_mould_risk(rules, i_h)
+
+    if i_t is None or i_h is None:
+        return result
+
+    i_ah = calculate_absolute_humidity(i_t, i_h)
+    result.indoor_ah = i_ah
+    result.water_content = round(i_ah * rules.volume, 1)
+
+    if surfaces and (dew_point := calculate_dew_point(i_t, i_h)) is not None:
+        result.dew_point = round(dew_point, 1)
+        result.surface_margins = tuple(None if t is None else round(t - dew_point, 1) for t in surfaces)
+        valid = [t for t in surfaces if t is not None]
+        if valid:
+            coldest = min(valid)
+            result.condensation_margin = round(coldest - dew_point, 1)
+            surface_risk = calculate_surface_mould_risk(calculate_surface_humidity(i_t, i_h, coldest))
+            result.mould_risk = max(calculate_mould_risk(rules, i_h), surface_risk)
+
+    if o_t is None or o_h is None:
+        return result
+
+    dp = i_ah - calculate_absolute_humidity(o_t, o_h)
+    result.drying_potential = round(dp, 2)
+    result.efficiency = calculate_efficiency(dp, i_t, i_h, o_t)
+
+    if result.mould_risk is not None:
+        result.advice = decide_advice(rules, result.mould_risk, result.drying_potential, result.efficiency, co2)
+
+    return result
@@ -11,32 +11,58 @@
 from .const import (
     CO2_CRITICAL,
     CO2_WARN,
+    CONF_ACTUATORS,
     CONF_AREA_ID,
     CONF_CEILING_HEIGHT,
     CONF_CO2_CRITICAL_OVERRIDE,
     CONF_CO2_SENSOR,
     CONF_CO2_WARN_OVERRIDE,
+    CONF_COMPACT_MODE,
+    CONF_CONTACT_SENSORS,
+    CONF_EXPOSED_METRICS,
     CONF_FLOOR_AREA,
     CONF_HAS_SLOPE,
     CONF_INDOOR_HUMIDITY,
     CONF_INDOOR_TEMP,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
     CONF_MOULD_CRITICAL_OVERRIDE,
     CONF_MOULD_SAFE_OVERRIDE,
     CONF_OUTDOOR_HUMIDITY,
     CONF_OUTDOOR_TEMP,
     CONF_ROOM_NAME,
     CONF_ROOMS,
+    CONF_SENSOR_WEIGHTS,
     CONF_SLOPE_A,
     CONF_SLOPE_B,
     CONF_SLOPE_C,
+    CONF_STATISTICS_MODE,
     CONF_STRATEGY,
+    CONF_SURFACE_SENSORS,
+    CONF_TREND_ADVICE,
     DEFAULT_CEILING_HEIGHT,
+    DEFAULT_COMPACT_MODE,
+    DEFAULT_MIN_OFF_TIME,
+    DEFAULT_MIN_ON_TIME,
+    DEFAULT_STATISTICS_MODE,
     DEFAULT_STRATEGY,
+    DEFAULT_TREND_ADVICE,
     DOMAIN,
     MOULD_RISK_CRITICAL,
     MOULD_RISK_SAFE,
+    ROOM_METRICS,
     STRATEGY_OPTIONS,
 )
+from .discovery import async_propose_rooms
+from .fusion import as_entity_list
+from .room_config import (
+    RoomImportError,
+    dump_rooms,
+    merge_rooms,
+    new_room_id,
+    parse_rooms_document,
+    unordered_thresholds,
+)
 
 
 class VentilationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -82,13 +108,16 @@ def __init__(self, config_entry):
         self._rooms = list(config_entry.options.get(CONF_ROOMS, []))
         self._current_room_index = None
         self._temp_room_data = {}
+        self._discovered = {}
+        self._discovered_queue = []
+        self._discovered_rooms = []
 
     async def async_step_init(self, user_input=None):
         """Manage rooms."""
-        menu_options = ["add_room"]
+        menu_options = ["add_room", "discover_rooms"]
         if self._rooms:
             menu_options.extend(["edit_room", "remove_room"])
-        menu_options.append("system_config")
+        menu_options.extend(["bulk_rooms", "system_config"])
 
         return self.async_show_menu(
             step_id="init",
@@ -104,8 +133,9 @@ async def _update_system_data(self, user_input):
             if key in user_input:
                 new_data[key] = user_input[key]
 
-        if CONF_STRATEGY in user_input:
-            new_options[CONF_STRATEGY] = user_input[CONF_STRATEGY]
+        for key in [CONF_STRATEGY, CONF_STATISTICS_MODE, CONF_COMPACT_MODE, CONF_TREND_ADVICE]:
+            if key in user_input:
+                new_options[key] = user_input[key]
 
         self.hass.config_entries.async_update_entry(self.entry, data=new_data, options=new_options)
         return self.async_create_entry(title="", data=new_options)
@@ -138,6 +168,18 @@ async def async_step_system_config(self, user_input=None):
                             mode=selector.SelectSelectorMode.DROPDOWN,
                         )
                     ),
+                    vol.Optional(
+                        CONF_STATISTICS_MODE,
+                        default=self.entry.options.get(CONF_STATISTICS_MODE, DEFAULT_STATISTICS_MODE),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COMPACT_MODE,
+                        default=self.entry.options.get(CONF_COMPACT_MODE, DEFAULT_COMPACT_MODE),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TREND_ADVICE,
+                        default=self.entry.options.get(CONF_TREND_ADVICE, DEFAULT_TREND_ADVICE),
+                    ): bool,
                 }
             ),
         )
@@ -185,6 +227,7 @@ async def async_step_room_base(self, user_input=None):
                     errors={"base": "name_required"},
                 )
 
+            self._temp_room_data.pop(CONF_AREA_ID, None)
             self._temp_room_data.update(user_input)
             if user_input.get(CONF_HAS_SLOPE):
                 return await self.async_step_room_slope()
@@ -199,7 +242,9 @@ def _get_room_base_schema(self, defaults):
         return vol.Schema(
             {
                 vol.Optional(CONF_ROOM_NAME, default=defaults.get(CONF_ROOM_NAME, "")): str,
-                vol.Optional(CONF_AREA_ID, default=defaults.get(CONF_AREA_ID)): selector.AreaSelector(),
+                vol.Optional(
+                    CONF_AREA_ID, description={"suggested_value": defaults.get(CONF_AREA_ID)}
+                ): selector.AreaSelector(),
                 vol.Required(
                     CONF_FLOOR_AREA,
                     default=defaults.get(CONF_FLOOR_AREA, 20.0),
@@ -245,18 +290,26 @@ def slope_selector():
         )
 
     async def async_step_room_sensors(self, user_input=None):
-        """Step 2: Sensors (filtered by area if possible)."""
+        """Step 2: Sensors."""
+        errors = {}
         if user_input is not None:
+            # A cleared optional sensor is left out of the input.
+            self._temp_room_data.pop(CONF_CO2_SENSOR, None)
             self._temp_room_data.update(user_input)
-            return await self.async_step_room_advanced()
-
-        area_id = self._temp_room_data.get(CONF_AREA_ID)
+            temps = as_entity_list(user_input.get(CONF_INDOOR_TEMP))
+            humidities = as_entity_list(user_input.get(CONF_INDOOR_HUMIDITY))
+            if not temps or not humidities:
+                errors["base"] = "sensor_required"
+            elif len(temps) > 1 or len(humidities) > 1:
+                return await self.async_step_room_weights()
+            else:
+                self._temp_room_data.pop(CONF_SENSOR_WEIGHTS, None)
+                return await self.async_step_room_advanced()
 
-        def filtered_selector(domain, device_class):
-            config = {"domain": domain, "device_class": device_class}
-            if area_id:
-                config["area"] = area_id
-            return selector.EntitySelector(selector.EntitySelectorConfig(**config))
+        def filtered_selector(domain, device_class, multiple=False):
+            return selector.EntitySelector(
+                selector.EntitySelectorConfig(domain=domain, device_class=device_class, multiple=multiple)
+            )
 
         return self.async_show_form(
             step_id="room_sensors",
@@ -264,37 +317,110 @@ def filtered_selector(domain, device_class):
                 {
                     vol.Required(
                         CONF_INDOOR_TEMP,
-                        default=self._temp_room_data.get(CONF_INDOOR_TEMP),
-                    ): filtered_selector("sensor", "temperature"),
+                        default=as_entity_list(self._temp_room_data.get(CONF_INDOOR_TEMP)),
+                    ): filtered_selector("sensor", "temperature", multiple=True),
                     vol.Required(
                         CONF_INDOOR_HUMIDITY,
-                        default=self._temp_room_data.get(CONF_INDOOR_HUMIDITY),
-                    ): filtered_selector("sensor", "humidity"),
+                        default=as_entity_list(self._temp_room_data.get(CONF_INDOOR_HUMIDITY)),
+                    ): filtered_selector("sensor", "humidity", multiple=True),
                     vol.Optional(
                         CONF_CO2_SENSOR,
-                        default=self._temp_room_data.get(CONF_CO2_SENSOR),
+                        description={"suggested_value": self._temp_room_data.get(CONF_CO2_SENSOR)},
                     ): filtered_selector("sensor", "carbon_dioxide"),
+                    vol.Optional(
+                        CONF_CONTACT_SENSORS,
+                        default=self._temp_room_data.get(CONF_CONTACT_SENSORS, []),
+                    ): filtered_selector("binary_sensor", ["window", "door", "opening"], multiple=True),
+                    vol.Optional(
+                        CONF_SURFACE_SENSORS,
+                        default=self._temp_room_data.get(CONF_SURFACE_SENSORS, []),
+                    ): filtered_selector("sensor", "temperature", multiple=True),
+                    vol.Optional(
+                        CONF_ACTUATORS,
+                        default=self._temp_room_data.get(CONF_ACTUATORS, []),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            filter=[
+                                selector.EntityFilterSelectorConfig(domain=["fan", "switch"]),
+                                selector.EntityFilterSelectorConfig(domain="humidifier", device_class="dehumidifier"),
+                            ],
+                            multiple=True,
+                        )
+                    ),
                 }
             ),
+            errors=errors,
         )
 
-    async def async_step_room_advanced(self, user_input=None):
-        """Step 3: Advanced Overrides (Strategy, Thresholds)."""
+    async def async_step_room_weights(self, user_input=None):
+        """Optional step: Weights for rooms with several temperature/humidity sensors."""
         if user_input is not None:
-            self._temp_room_data.update(user_input)
+            self._temp_room_data[CONF_SENSOR_WEIGHTS] = user_input
+            return await self.async_step_room_advanced()
 
-            if self._current_room_index is not None:
-                self._rooms[self._current_room_index] = self._temp_room_data
-            else:
-                self._temp_room_data["id"] = str(len(self._rooms))
-                self._rooms.append(self._temp_room_data)
+        weights = self._temp_room_data.get(CONF_SENSOR_WEIGHTS, {})
+        members = dict.fromkeys(
+            as_entity_list(self._temp_room_data[CONF_INDOOR_TEMP])
+            + as_entity_list(self._temp_room_data[CONF_INDOOR_HUMIDITY])
+        )
 
-            return await self._update_rooms()
+        return self.async_show_form(
+            step_id="room_weights",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(entity_id, default=weights.get(entity_id, 1.0)): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0.1, max=10, step=0.1, mode=selector.NumberSelectorMode.BOX)
+                    )
+                    for entity_id in members
+                }
+            ),
+        )
 
-        def num_selector(unit):
-            return selector.NumberSelector(
-                selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX, unit_of_measurement=unit)
+    async def async_step_room_advanced(self, user_input=None):
+        """Step 3: Advanced Overrides (Strategy, Thresholds)."""
+        errors = {}
+        has_actuators = bool(self._temp_room_data.get(CONF_ACTUATORS))
+        if user_input is not None:
+            self._temp_room_data.update(user_input)
+            if not has_actuators:
+                self._temp_room_data.pop(CONF_MIN_ON_TIME, None)
+                self._temp_room_data.pop(CONF_MIN_OFF_TIME, None)
+            # Same checks as a room import, so rooms made here can be exported and imported again.
+            for _lower, upper in unordered_thresholds(user_input):
+                errors[upper] = "threshold_order"
+
+            if not errors:
+                if self._current_room_index is not None:
+                    self._rooms[self._current_room_index] = self._temp_room_data
+                else:
+                    self._temp_room_data["id"] = new_room_id(self._rooms)
+                    self._rooms.append(self._temp_room_data)
+
+                return await self._update_rooms()
+
+        def num_selector(unit, maximum=None):
+            config = selector.NumberSelectorConfig(
+                min=0, mode=selector.NumberSelectorMode.BOX, unit_of_measurement=unit
             )
+            if maximum is not None:
+                config["max"] = maximum
+            return selector.NumberSelector(config)
+
+        # Switching times only apply to rooms with fans or dehumidifiers.
+        switching_times = (
+            {
+                vol.Optional(
+                    CONF_MIN_ON_TIME,
+                    default=self._temp_room_data.get(CONF_MIN_ON_TIME, DEFAULT_MIN_ON_TIME),
+                ): num_selector("min", 240),
+                vol.Optional(
+                    CONF_MIN_OFF_TIME,
+                    default=self._temp_room_data.get(CONF_MIN_OFF_TIME, DEFAULT_MIN_OFF_TIME),
+                ): num_selector("min", 240),
+            }
+            if has_actuators
+            else {}
+        )
 
         return self.async_show_form(
             step_id="room_advanced",
@@ -312,11 +438,11 @@ def num_selector(unit):
                     vol.Optional(
                         CONF_MOULD_SAFE_OVERRIDE,
                         default=self._temp_room_data.get(CONF_MOULD_SAFE_OVERRIDE, MOULD_RISK_SAFE),
-                    ): num_selector("%"),
+                    ): num_selector("%", 100),
                     vol.Optional(
                         CONF_MOULD_CRITICAL_OVERRIDE,
                         default=self._temp_room_data.get(CONF_MOULD_CRITICAL_OVERRIDE, MOULD_RISK_CRITICAL),
-                    ): num_selector("%"),
+                    ): num_selector("%", 100),
                     vol.Optional(
                         CONF_CO2_WARN_OVERRIDE,
                         default=self._temp_room_data.get(CONF_CO2_WARN_OVERRIDE, CO2_WARN),
@@ -325,8 +451,20 @@ def num_selector(unit):
                         CONF_CO2_CRITICAL_OVERRIDE,
                         default=self._temp_room_data.get(CONF_CO2_CRITICAL_OVERRIDE, CO2_CRITICAL),
                     ): num_selector("ppm"),
+                    **switching_times,
+                    vol.Optional(
+                        CONF_EXPOSED_METRICS,
+                        default=self._temp_room_data.get(CONF_EXPOSED_METRICS, []),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=ROOM_METRICS,
+                            multiple=True,
+                            translation_key=CONF_EXPOSED_METRICS,
+                        )
+                    ),
                 }
             ),
+            errors=errors,
         )
 
     async def async_step_remove_room(self, user_input=None):
@@ -345,6 +483,110 @@ async def async_step_remove_room(self, user_input=None):
             data_schema=vol.Schema({vol.Required("room_to_remove"): vol.In(room_names)}),
         )
 
+    async def async_step_discover_rooms(self, user_input=None):
+        """Propose rooms for areas with temperature and humidity sensors and add the accepted ones together."""
+        if user_input is not None:
+            self._discovered_queue = list(user_input["areas"])
+            self._discovered_rooms = []
+            return await self.async_step_discover_geometry()
+
+        outdoor = (self.entry.data.get(CONF_OUTDOOR_TEMP), self.entry.data.get(CONF_OUTDOOR_HUMIDITY))
+        self._discovered = async_propose_rooms(self.hass, self._rooms, reserved=filter(None, outdoor))
+        if not self._discovered:
+            return self.async_abort(reason="no_rooms_discovered")
+
+        options = []
+        summary = []
+        for area_id, room in self._discovered.items():
+            label = room[CONF_ROOM_NAME]
+            if CONF_CO2_SENSOR in room:
+                label = f"{label} (CO2)"
+            options.append(selector.SelectOptionDict(value=area_id, label=label))
+            sources = [
+                *room[CONF_INDOOR_TEMP],
+                *room[CONF_INDOOR_HUMIDITY],
+                *filter(None, [room.get(CONF_CO2_SENSOR)]),
+                *room.get(CONF_CONTACT_SENSORS, []),
+            ]
+            summary.append(f"- **{room[CONF_ROOM_NAME]}**: {', '.join(sources)}")
+
+        return self.async_show_form(
+            step_id="discover_rooms",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("areas", default=list(self._discovered)): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=options, multiple=True)
+                    ),
+                }
+            ),
+            description_placeholders={"count": str(len(self._discovered)), "rooms": "\n".join(summary)},
+        )
+
+    async def async_step_discover_geometry(self, user_input=None):
+        """Ask for the geometry of each accepted room, then add them all in one update."""
+        if user_input is not None:
+            room = {**self._discovered[self._discovered_queue.pop(0)], **user_input}
+            room["id"] = new_room_id([*self._rooms, *self._discovered_rooms])
+            self._discovered_rooms.append(room)
+
+        if not self._discovered_queue:
+            self._rooms.extend(self._discovered_rooms)
+            return await self._update_rooms()
+
+        room = self._discovered[self._discovered_queue[0]]
+        return self.async_show_form(
+            step_id="discover_geometry",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_FLOOR_AREA): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1, max=1000, step=0.1, mode=selector.NumberSelectorMode.BOX, unit_of_measurement="m²"
+                        )
+                    ),
+                    vol.Required(CONF_CEILING_HEIGHT, default=room[CONF_CEILING_HEIGHT]): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1, max=10, step=0.1, mode=selector.NumberSelectorMode.BOX, unit_of_measurement="m"
+                        )
+                    ),
+                }
+            ),
+            description_placeholders={
+                "name": room[CONF_ROOM_NAME],
+                "position": str(len(self._discovered_rooms) + 1),
+                "total": str(len(self._discovered_rooms) + len(self._discovered_queue)),
+            },
+        )
+
+    async def async_step_bulk_rooms(self, user_input=None):
+        """Import, export or bulk-edit all rooms as one YAML/JSON document."""
+        errors = {}
+        placeholders = {"errors": ""}
+        document = dump_rooms(self._rooms) if self._rooms else ""
+        if user_input is not None:
+            document = user_input.get("document", "")
+            try:
+                imported = parse_rooms_document(document)
+            except RoomImportError as err:
+                errors["base"] = "invalid_rooms"
+                placeholders["errors"] = str(err)
+            else:
+                self._rooms = merge_rooms(self._rooms, imported, replace=user_input.get("replace", False))
+                return await self._update_rooms()
+
+        return self.async_show_form(
+            step_id="bulk_rooms",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("document", default=document): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional("replace", default=False): bool,
+                }
+            ),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
     async def _update_rooms(self):
         """Update the config entry options."""
         return self.async_create_entry(title="", data={**self.entry.options, CONF_ROOMS: self._rooms})
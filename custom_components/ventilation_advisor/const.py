@@ -26,10 +26,57 @@
 CONF_MOULD_CRITICAL_OVERRIDE = "mould_critical_override"
 CONF_CO2_WARN_OVERRIDE = "co2_warn_override"
 CONF_CO2_CRITICAL_OVERRIDE = "co2_critical_override"
+CONF_STATISTICS_MODE = "statistics_mode"
+CONF_CONTACT_SENSORS = "contact_sensors"
+CONF_SENSOR_WEIGHTS = "sensor_weights"
+CONF_COMPACT_MODE = "compact_mode"
+CONF_EXPOSED_METRICS = "exposed_metrics"
+CONF_TREND_ADVICE = "trend_advice"
+CONF_SURFACE_SENSORS = "surface_sensors"
+CONF_ACTUATORS = "actuators"
+CONF_MIN_ON_TIME = "min_on_time"
+CONF_MIN_OFF_TIME = "min_off_time"
 
 # Defaults
 DEFAULT_CEILING_HEIGHT = 2.8
 DEFAULT_STRATEGY = "Balanced"
+DEFAULT_STATISTICS_MODE = False
+DEFAULT_COMPACT_MODE = False
+DEFAULT_TREND_ADVICE = False
+DEFAULT_MIN_ON_TIME = 10  # Minutes
+DEFAULT_MIN_OFF_TIME = 10  # Minutes
+
+# Downsampled statistics mode: minutes between entity state writes of high-frequency metrics
+STATISTICS_STATE_INTERVAL = "/15"
+
+# Room metrics; in compact mode they are attributes of the advice entity unless exposed individually
+METRIC_INDOOR_AH = "indoor_ah"
+METRIC_WATER_CONTENT = "water_content"
+METRIC_MOULD_RISK = "mould_risk"
+METRIC_DRYING_POTENTIAL = "drying_potential"
+METRIC_EFFICIENCY = "efficiency"
+METRIC_VOLUME = "volume"
+METRIC_AIR_CHANGE_RATE = "air_change_rate"
+METRIC_LAST_SESSION = "last_session"
+METRIC_TREND = "trend"
+METRIC_HUMIDITY_TREND = "humidity_trend"  # Attributes of the trend metric
+METRIC_WATER_TREND = "water_trend"
+METRIC_MOISTURE_EVENT = "moisture_event"
+METRIC_CONDENSATION_MARGIN = "condensation_margin"
+
+ROOM_METRICS = [
+    METRIC_INDOOR_AH,
+    METRIC_WATER_CONTENT,
+    METRIC_MOULD_RISK,
+    METRIC_DRYING_POTENTIAL,
+    METRIC_EFFICIENCY,
+    METRIC_VOLUME,
+    METRIC_AIR_CHANGE_RATE,
+    METRIC_LAST_SESSION,
+    METRIC_TREND,
+    METRIC_MOISTURE_EVENT,
+    METRIC_CONDENSATION_MARGIN,
+]
 
 # Strategy Options
 STRATEGY_ENERGY_SAVER = "Energy Saver"
@@ -66,3 +113,50 @@
 MOULD_RISK_CRITICAL = 80
 CO2_WARN = 1000
 CO2_CRITICAL = 1500
+
+# Surface humidity limits for mould growth on cold surfaces (DIN 4108-2 uses 80% as critical)
+SURFACE_MOULD_SAFE = 70
+SURFACE_MOULD_CRITICAL = 80
+
+# Air change estimation from CO2 decay
+CO2_OUTDOOR_BASELINE = 420
+AIR_CHANGE_WINDOW = 240  # Max CO2 samples fitted per decay episode
+AIR_CHANGE_MIN_DROP = 200  # ppm the CO2 level must fall for an episode to count
+AIR_CHANGE_MIN_DURATION = 600  # Seconds
+AIR_CHANGE_MIN_EXCESS = 50  # ppm above outdoor level below which the log-fit gets too noisy
+AIR_CHANGE_END_RISE = 75  # ppm rise above the episode minimum that ends the decay, above NDIR sensor noise
+AIR_CHANGE_END_SAMPLES = 3  # Consecutive samples the rise must persist for
+AIR_CHANGE_MIN_R2 = 0.8
+AIR_CHANGE_SMOOTHING = 0.3
+
+# Multi-sensor fusion: members silent for longer than this are skipped (seconds)
+FUSION_STALE_AFTER = 7200
+
+# Ventilation sessions
+SESSION_LOG_SIZE = 20  # Finished sessions kept in memory per room
+
+# Humidity trends: least-squares slope of indoor absolute humidity over a sliding window
+TREND_WINDOW = 3600  # Seconds
+TREND_CAPACITY = 256  # Samples kept per room
+TREND_MIN_SPACING = 15  # Seconds; faster samples replace the newest one
+TREND_MIN_SAMPLES = 5
+TREND_MIN_SPAN = 900  # Seconds the samples must cover before a slope is reported
+TREND_REBASE = 86400  # Seconds after which sample times are re-centred
+TREND_RISING_AH = 1.0  # g/m³ per hour flagged as rapidly rising
+
+# Moisture events: time-weighted one-sided CUSUM of absolute humidity above its baseline
+EVENT_MOISTURE = f"{DOMAIN}_moisture_event"
+MOISTURE_DRIFT = 0.5  # g/m³ above the baseline tolerated as normal fluctuation
+MOISTURE_THRESHOLD = 4.0  # g/m³ x minutes of accumulated excess that starts an event
+MOISTURE_BASELINE_TAU = 10800  # Seconds; time constant of the baseline outside events
+MOISTURE_MAX_STEP = 600  # Seconds; longer gaps between samples count as this long
+MOISTURE_MAX_DURATION = 7200  # Seconds after which an event ends and the baseline restarts
+
+# Actuation: pending fan/dehumidifier/switch commands are flushed in batches
+ACTUATION_INTERVAL = 10  # Seconds between batches
+ACTUATION_MAX_PER_BATCH = 10  # Entities switched per batch across all rooms
+DEHUMIDIFY_START_RISK = 40  # Mould risk (%) at which a stopped dehumidifier starts
+DEHUMIDIFY_STOP_RISK = 10  # Mould risk (%) at or below which a running dehumidifier stops
+
+# Storage
+STORAGE_VERSION = 1
@@ -0,0 +1,434 @@
+"""Evaluation coordinator for Ventilation Advisor."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfTemperature
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_state_change_event, async_track_utc_time_change
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+from .actuation import ActuationController
+from .air_change import AirChangeEstimator
+from .calculations import (
+    RoomRules,
+    apply_humidity_trend,
+    apply_moisture_event,
+    calculate_absolute_humidity,
+    compile_room_rules,
+    evaluate_room,
+)
+from .const import (
+    CONF_ACTUATORS,
+    CONF_CO2_SENSOR,
+    CONF_CONTACT_SENSORS,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_OUTDOOR_HUMIDITY,
+    CONF_OUTDOOR_TEMP,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    CONF_SENSOR_WEIGHTS,
+    CONF_STATISTICS_MODE,
+    CONF_STRATEGY,
+    CONF_SURFACE_SENSORS,
+    CONF_TREND_ADVICE,
+    DEFAULT_STATISTICS_MODE,
+    DEFAULT_STRATEGY,
+    DEFAULT_TREND_ADVICE,
+    DOMAIN,
+    EVENT_MOISTURE,
+    LOGGER,
+    STATISTICS_STATE_INTERVAL,
+    STORAGE_VERSION,
+)
+from .data import RoomResult
+from .fusion import FusedSource, as_entity_list
+from .moisture import MoistureEventDetector
+from .sessions import SessionTracker
+from .statistics import VentilationStatistics
+from .trend import TrendBuffer
+
+# Listener key for entities that only depend on the outdoor sources.
+SYSTEM_KEY = None
+
+
+def _identity(value: float) -> float:
+    return value
+
+
+def _is_valid(state: State | None) -> bool:
+    return state is not None and state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+
+
+# Unit binding of a source: (bound unit, converter); temperatures become °C, other units pass through.
+_UNBOUND: tuple[str | None, Callable[[float], float]] = (None, _identity)
+
+
+def _room_fusion(room: dict, key: str) -> FusedSource:
+    weights = room.get(CONF_SENSOR_WEIGHTS, {})
+    return FusedSource({entity_id: float(weights.get(entity_id, 1.0)) for entity_id in as_entity_list(room[key])})
+
+
+class VentilationCoordinator:
+    """Evaluate all rooms from their source sensors and push the results to entities."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.entry = entry
+        self.rooms: dict[str, dict] = {
+            room.get("id", room[CONF_ROOM_NAME]): room for room in entry.options.get(CONF_ROOMS, [])
+        }
+        default_strategy = entry.options.get(CONF_STRATEGY, DEFAULT_STRATEGY)
+        trend_advice = entry.options.get(CONF_TREND_ADVICE, DEFAULT_TREND_ADVICE)
+        self.rules: dict[str, RoomRules] = {
+            room_id: compile_room_rules(room, room.get(CONF_STRATEGY, default_strategy), trend_advice)
+            for room_id, room in self.rooms.items()
+        }
+        self.outdoor_ah: float | None = None
+        self.results: dict[str, RoomResult] = {}
+        self.statistics = (
+            VentilationStatistics(hass, self.rooms)
+            if entry.options.get(CONF_STATISTICS_MODE, DEFAULT_STATISTICS_MODE)
+            else None
+        )
+        self.air_change: dict[str, AirChangeEstimator] = {
+            room_id: AirChangeEstimator() for room_id, room in self.rooms.items() if room.get(CONF_CO2_SENSOR)
+        }
+        self.sessions: dict[str, SessionTracker] = {
+            room_id: SessionTracker() for room_id, room in self.rooms.items() if room.get(CONF_CONTACT_SENSORS)
+        }
+        self.fusion: dict[str, tuple[FusedSource, FusedSource]] = {
+            room_id: (_room_fusion(room, CONF_INDOOR_TEMP), _room_fusion(room, CONF_INDOOR_HUMIDITY))
+            for room_id, room in self.rooms.items()
+        }
+        self.trends: dict[str, TrendBuffer] = {room_id: TrendBuffer() for room_id in self.rooms}
+        self.actuation = (
+            ActuationController(hass, self) if any(room.get(CONF_ACTUATORS) for room in self.rooms.values()) else None
+        )
+        self.moisture: dict[str, MoistureEventDetector] = {room_id: MoistureEventDetector() for room_id in self.rooms}
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+        self._entities: dict[str | None, list[Entity]] = {}
+        self._downsampled_entities: dict[str | None, list[Entity]] = {}
+        self._cycle_listeners: list[Callable[[set[str] | None, bool], None]] = []
+        self._source_rooms: dict[str, set[str]] = {}
+        self._fusion_members: dict[str, list[FusedSource]] = {}
+        self._co2_rooms: dict[str, list[str]] = {}
+        self._contact_rooms: dict[str, list[str]] = {}
+        self._units: dict[str, tuple[str | None, Callable[[float], float]]] = {}
+        self._started = False
+
+    async def async_load(self) -> None:
+        """Restore learned per-room state from storage."""
+        if not (data := await self._store.async_load()):
+            return
+        for room_id, stored in data.get("air_change", {}).items():
+            if estimator := self.air_change.get(room_id):
+                estimator.restore(stored)
+
+    async def async_save(self) -> None:
+        """Write learned per-room state now, replacing a pending delayed save."""
+        if self.air_change:
+            await self._store.async_save(self._data_to_store())
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen to all source sensors and defer the first pass until Home Assistant has started."""
+        now = dt_util.utcnow().timestamp()
+        for room_id, room in self.rooms.items():
+            for fused in self.fusion[room_id]:
+                for entity_id in fused.members:
+                    self._source_rooms.setdefault(entity_id, set()).add(room_id)
+                    self._fusion_members.setdefault(entity_id, []).append(fused)
+            if co2_sensor := room.get(CONF_CO2_SENSOR):
+                self._source_rooms.setdefault(co2_sensor, set()).add(room_id)
+            for entity_id in room.get(CONF_SURFACE_SENSORS, []):
+                self._source_rooms.setdefault(entity_id, set()).add(room_id)
+            if room_id in self.air_change:
+                self._co2_rooms.setdefault(room[CONF_CO2_SENSOR], []).append(room_id)
+            for entity_id in room.get(CONF_CONTACT_SENSORS, []):
+                self._contact_rooms.setdefault(entity_id, []).append(room_id)
+                if _is_valid(state := self.hass.states.get(entity_id)):
+                    assert state is not None
+                    self.sessions[room_id].seed(entity_id, state.state == STATE_ON)
+
+        for entity_id in {self._outdoor_temp, self._outdoor_humidity, *self._source_rooms}:
+            self._bind_unit(entity_id, self.hass.states.get(entity_id))
+        for entity_id in self._fusion_members:
+            self._update_fusion(entity_id, self.hass.states.get(entity_id), now)
+
+        entity_ids = {*self._units, *self._contact_rooms}
+        self.entry.async_on_unload(
+            async_track_state_change_event(self.hass, list(entity_ids), self._async_source_changed)
+        )
+        self.entry.async_on_unload(async_at_started(self.hass, self._async_started))
+        self.entry.async_on_unload(self._async_shutdown)
+        if self.actuation:
+            self.actuation.async_setup()
+        if self.statistics:
+            self.entry.async_on_unload(
+                async_track_utc_time_change(
+                    self.hass, self._async_statistics_tick, minute=STATISTICS_STATE_INTERVAL, second=0
+                )
+            )
+
+    @callback
+    def async_add_listener(
+        self, room_id: str | None, entity: Entity, high_frequency: bool = False
+    ) -> Callable[[], None]:
+        """Register an entity to be written after its room is evaluated.
+
+        In downsampled statistics mode, high-frequency entities are only written on the
+        coarse statistics interval or when the room's advice changes.
+        """
+        listeners = self._downsampled_entities if high_frequency and self.statistics else self._entities
+        listeners.setdefault(room_id, []).append(entity)
+
+        @callback
+        def remove_listener() -> None:
+            listeners[room_id].remove(entity)
+
+        return remove_listener
+
+    @callback
+    def async_add_cycle_listener(self, listener: Callable[[set[str] | None, bool], None]) -> Callable[[], None]:
+        """Call `listener(changed_room_ids, outdoor_evaluated)` after every evaluation pass.
+
+        The listener is called once with `None` when the coordinator shuts down.
+        """
+        self._cycle_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._cycle_listeners:
+                self._cycle_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_refresh(self) -> None:
+        """Evaluate every room in one pass and write all states together."""
+        self._async_evaluate(self.rooms, include_system=True)
+
+    @property
+    def _outdoor_temp(self) -> str:
+        return self.entry.data[CONF_OUTDOOR_TEMP]
+
+    @property
+    def _outdoor_humidity(self) -> str:
+        return self.entry.data[CONF_OUTDOOR_HUMIDITY]
+
+    @callback
+    def _async_shutdown(self) -> None:
+        listeners, self._cycle_listeners = self._cycle_listeners, []
+        for listener in listeners:
+            listener(None, False)
+
+    @callback
+    def _async_started(self, _hass: HomeAssistant) -> None:
+        self._started = True
+        LOGGER.debug("Home Assistant started, evaluating %s rooms", len(self.rooms))
+        self.async_refresh()
+        self._async_write_downsampled()
+
+    @callback
+    def _async_statistics_tick(self, now: datetime) -> None:
+        if self.statistics:
+            self.statistics.async_publish(now)
+        self._async_write_downsampled()
+
+    @callback
+    def _async_write_downsampled(self) -> None:
+        for entities in self._downsampled_entities.values():
+            for entity in entities:
+                entity.async_write_ha_state()
+
+    @callback
+    def _async_source_changed(self, event: Event[EventStateChangedData]) -> None:
+        entity_id = event.data["entity_id"]
+        if (
+            (new_state := event.data["new_state"]) is not None
+            and (binding := self._units.get(entity_id)) is not None
+            and new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) != binding[0]
+        ):
+            self._bind_unit(entity_id, new_state)
+        if entity_id in self._contact_rooms:
+            self._async_contact_changed(entity_id, event.data["old_state"], event.data["new_state"])
+            return
+        if entity_id in self._co2_rooms:
+            self._async_co2_sample(entity_id, event.data["new_state"])
+        if entity_id in self._fusion_members:
+            self._update_fusion(entity_id, event.data["new_state"], dt_util.utcnow().timestamp())
+
+        include_system = entity_id in (self._outdoor_temp, self._outdoor_humidity)
+        room_ids: Iterable[str] = self.rooms if include_system else self._source_rooms.get(entity_id, ())
+
+        if not self._started:
+            # Sources come online one by one during boot; only evaluate rooms that are complete.
+            if not self._outdoor_valid():
+                return
+            room_ids = [room_id for room_id in room_ids if self._room_valid(room_id)]
+
+        self._async_evaluate(room_ids, include_system)
+
+    @callback
+    def _async_co2_sample(self, entity_id: str, new_state: State | None) -> None:
+        if (ppm := self._parse_float(new_state)) is None:
+            return
+        assert new_state is not None
+        updated = False
+        for room_id in self._co2_rooms[entity_id]:
+            if self.air_change[room_id].add_sample(ppm, new_state.last_updated):
+                LOGGER.debug("Learned air change rate of room %s: %s", room_id, self.air_change[room_id].learned_ach)
+                updated = True
+        if updated:
+            self._store.async_delay_save(self._data_to_store, 60)
+
+    @callback
+    def _async_contact_changed(self, entity_id: str, old_state: State | None, new_state: State | None) -> None:
+        if not _is_valid(new_state):
+            return
+        assert new_state is not None
+        if not _is_valid(old_state):
+            # First known state, e.g. restored during boot: the contact did not just open or close.
+            for room_id in self._contact_rooms[entity_id]:
+                self.sessions[room_id].seed(entity_id, new_state.state == STATE_ON)
+            return
+        finished = []
+        now = dt_util.utcnow().timestamp()
+        for room_id in self._contact_rooms[entity_id]:
+            room = self.rooms[room_id]
+            result = self.results.get(room_id)
+            snapshot = (
+                result.water_content if result else None,
+                self._get_float_state(room.get(CONF_CO2_SENSOR)),
+                self._fused_value(self.fusion[room_id][0], now),
+            )
+            if self.sessions[room_id].contact_changed(
+                entity_id, new_state.state == STATE_ON, new_state.last_changed, snapshot
+            ):
+                finished.append(room_id)
+        if finished:
+            self._async_evaluate(finished)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {"air_change": {room_id: estimator.as_dict() for room_id, estimator in self.air_change.items()}}
+
+    @callback
+    def _async_evaluate(self, room_ids: Iterable[str], include_system: bool = False) -> None:
+        o_t = self._get_float_state(self._outdoor_temp)
+        o_h = self._get_float_state(self._outdoor_humidity)
+        self.outdoor_ah = calculate_absolute_humidity(o_t, o_h) if o_t is not None and o_h is not None else None
+
+        now = dt_util.utcnow()
+        now_ts = now.timestamp()
+        if self.statistics and include_system:
+            self.statistics.async_add_outdoor(self.outdoor_ah, now)
+
+        evaluated = []
+        changed = set()
+        advice_changed = set()
+        for room_id in room_ids:
+            room = self.rooms[room_id]
+            temp_fusion, humidity_fusion = self.fusion[room_id]
+            rules = self.rules[room_id]
+            previous = self.results.get(room_id)
+            result = self.results[room_id] = evaluate_room(
+                rules,
+                self._fused_value(temp_fusion, now_ts),
+                self._fused_value(humidity_fusion, now_ts),
+                o_t,
+                o_h,
+                co2=self._get_float_state(room.get(CONF_CO2_SENSOR)),
+                surfaces=[self._get_float_state(entity_id) for entity_id in room.get(CONF_SURFACE_SENSORS, ())],
+            )
+            if result.indoor_ah is not None:
+                trend = self.trends[room_id]
+                trend.add(now_ts, result.indoor_ah)
+                apply_humidity_trend(rules, result, trend.slope)
+                detector = self.moisture[room_id]
+                if transition := detector.update(now_ts, result.indoor_ah, rules.volume):
+                    self.hass.bus.async_fire(
+                        EVENT_MOISTURE,
+                        {
+                            "room_id": room_id,
+                            "name": room[CONF_ROOM_NAME],
+                            "type": transition,
+                            "added_water": detector.added_water,
+                        },
+                    )
+                apply_moisture_event(result, detector.active)
+            evaluated.append(room_id)
+            if result != previous:
+                changed.add(room_id)
+            if self.statistics:
+                self.statistics.async_add_room(room_id, result, now)
+                if previous is None or previous.advice != result.advice:
+                    advice_changed.add(room_id)
+
+        if include_system:
+            evaluated.append(SYSTEM_KEY)
+        for key in evaluated:
+            for entity in self._entities.get(key, ()):
+                entity.async_write_ha_state()
+        for key in advice_changed:
+            for entity in self._downsampled_entities.get(key, ()):
+                entity.async_write_ha_state()
+        for listener in self._cycle_listeners:
+            listener(changed, include_system)
+
+    def _outdoor_valid(self) -> bool:
+        return (
+            self._get_float_state(self._outdoor_temp) is not None
+            and self._get_float_state(self._outdoor_humidity) is not None
+        )
+
+    def _room_valid(self, room_id: str) -> bool:
+        now = dt_util.utcnow().timestamp()
+        return all(self._fused_value(fused, now) is not None for fused in self.fusion[room_id])
+
+    def _update_fusion(self, entity_id: str, state: State | None, now: float) -> None:
+        value = self._parse_float(state)
+        timestamp = state.last_reported.timestamp() if state else now
+        for fused in self._fusion_members[entity_id]:
+            fused.update(entity_id, value, timestamp, now)
+
+    def _fused_value(self, fused: FusedSource, now: float) -> float | None:
+        # Members that went quiet may still be reporting unchanged values; re-check before dropping them.
+        for entity_id in fused.stale_members(now):
+            state = self.hass.states.get(entity_id)
+            fused.update(entity_id, self._parse_float(state), state.last_reported.timestamp() if state else 0.0, now)
+        return fused.value
+
+    def _get_float_state(self, entity_id: str | None) -> float | None:
+        if not entity_id:
+            return None
+        return self._parse_float(self.hass.states.get(entity_id))
+
+    def _bind_unit(self, entity_id: str, state: State | None) -> None:
+        """Choose the conversion of a source once, from its current unit of measurement."""
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) if state else None
+        convert = _identity
+        if unit in TemperatureConverter.VALID_UNITS:
+            convert = TemperatureConverter.converter_factory(unit, UnitOfTemperature.CELSIUS)
+        self._units[entity_id] = (unit, convert)
+
+    def _parse_float(self, state: State | None) -> float | None:
+        if state and state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            try:
+                value = float(state.state)
+            except ValueError:
+                return None
+            _unit, convert = self._units.get(state.entity_id, _UNBOUND)
+            return convert(value)
+        return None
@@ -0,0 +1,187 @@
+"""Data classes for Ventilation Advisor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .coordinator import VentilationCoordinator
+
+
+class Efficiency(IntEnum):
+    """Ventilation efficiency class, ordered so that everything from HIGH up counts as high."""
+
+    UNKNOWN = 0
+    COUNTER_PRODUCTIVE = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    HIGH_FREE_COOLING = 5
+
+    @property
+    def label(self) -> str:
+        """Return the state shown by the efficiency sensor."""
+        return EFFICIENCY_LABELS[self]
+
+
+EFFICIENCY_LABELS = (
+    "Unknown",
+    "Counter-Productive",
+    "Low (Wasteful)",
+    "Medium",
+    "High",
+    "High (Free Cooling)",
+)
+
+
+class Advice(IntEnum):
+    """Master advice outcome."""
+
+    UNKNOWN = 0
+    URGENT_MOULD = 1
+    URGENT_AIR_QUALITY = 2
+    RECOMMENDED_FRESH_AIR = 3
+    HOLD_INEFFECTIVE = 4
+    OPTIONAL_EFFICIENT = 5
+    HOLD_ECO = 6
+    RECOMMENDED_DRYING = 7
+    RECOMMENDED = 8
+    RECOMMENDED_QUICK = 9
+    HOLD_LOW_NECESSITY = 10
+    RECOMMENDED_RISING = 11
+    URGENT_MOISTURE = 12
+
+    @property
+    def label(self) -> str:
+        """Return the state shown by the master advice sensor."""
+        return ADVICE_LABELS[self]
+
+    @property
+    def recommends_ventilation(self) -> bool:
+        """Return True for urgent and recommended advice."""
+        return self in VENTILATION_ADVICE
+
+
+ADVICE_LABELS = (
+    "Unknown",
+    "Urgent (Mould Risk)",
+    "Urgent (Air Quality)",
+    "Recommended (Fresh Air)",
+    "Hold (Ineffective)",
+    "Optional (Efficient)",
+    "Hold (Eco Mode)",
+    "Recommended (Drying)",
+    "Recommended",
+    "Recommended (Quick)",
+    "Hold (Low Necessity)",
+    "Recommended (Rising Humidity)",
+    "Urgent (Moisture Event)",
+)
+
+VENTILATION_ADVICE = frozenset(
+    {
+        Advice.URGENT_MOULD,
+        Advice.URGENT_AIR_QUALITY,
+        Advice.RECOMMENDED_FRESH_AIR,
+        Advice.RECOMMENDED_DRYING,
+        Advice.RECOMMENDED,
+        Advice.RECOMMENDED_QUICK,
+        Advice.RECOMMENDED_RISING,
+        Advice.URGENT_MOISTURE,
+    }
+)
+
+
+@dataclass(slots=True)
+class RoomResult:
+    """Derived metrics of one room after an evaluation pass."""
+
+    volume: float
+    indoor_ah: float | None = None
+    water_content: float | None = None
+    mould_risk: float | None = None
+    drying_potential: float | None = None
+    efficiency: Efficiency = Efficiency.UNKNOWN
+    advice: Advice = Advice.UNKNOWN
+    humidity_trend: float | None = None
+    water_trend: float | None = None
+    moisture_event: bool = False
+    dew_point: float | None = None
+    # Surface temperature minus dew point (K) per surface sensor, and the smallest of them.
+    surface_margins: tuple[float | None, ...] = ()
+    condensation_margin: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a compact serializable form."""
+        return {
+            "advice": self.advice.label,
+            "efficiency": self.efficiency.label,
+            "indoor_ah": self.indoor_ah,
+            "water_content": self.water_content,
+            "mould_risk": self.mould_risk,
+            "drying_potential": self.drying_potential,
+            "volume": self.volume,
+            "humidity_trend": self.humidity_trend,
+            "water_trend": self.water_trend,
+            "moisture_event": self.moisture_event,
+            "condensation_margin": self.condensation_margin,
+        }
+
+
+@dataclass(slots=True)
+class VentilationSession:
+    """One window/door opening of a room, from first contact opened to last contact closed."""
+
+    start: datetime
+    start_water: float | None
+    start_co2: float | None
+    start_temp: float | None
+    end: datetime | None = None
+    end_water: float | None = None
+    end_co2: float | None = None
+    end_temp: float | None = None
+
+    @property
+    def water_removed(self) -> float | None:
+        """Grams of water removed from the room air."""
+        if self.start_water is None or self.end_water is None:
+            return None
+        return round(self.start_water - self.end_water, 1)
+
+    @property
+    def temperature_drop(self) -> float | None:
+        """Indoor temperature drop in °C."""
+        if self.start_temp is None or self.end_temp is None:
+            return None
+        return round(self.start_temp - self.end_temp, 1)
+
+    @property
+    def duration(self) -> float | None:
+        """Session length in minutes."""
+        if self.end is None:
+            return None
+        return round((self.end - self.start).total_seconds() / 60, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable summary."""
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "duration_min": self.duration,
+            "water_removed_g": self.water_removed,
+            "temperature_drop": self.temperature_drop,
+            "start_co2": self.start_co2,
+            "end_co2": self.end_co2,
+        }
+
+
+@dataclass(slots=True)
+class VentilationData:
+    """Runtime data stored on the config entry."""
+
+    coordinator: VentilationCoordinator
+    # Unique ids created by the platforms; registry entries outside this set are removed.
+    unique_ids: set[str] = field(default_factory=set)
@@ -12,6 +12,7 @@
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
     return {
         "entry": {
             "title": entry.title,
@@ -19,6 +20,15 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             "options": dict(entry.options),
         },
         "rooms_count": len(entry.options.get(CONF_ROOMS, [])),
+        "air_change": {room_id: estimator.as_dict() for room_id, estimator in coordinator.air_change.items()},
+        "sessions": {
+            room_id: [session.as_dict() for session in tracker.log] for room_id, tracker in coordinator.sessions.items()
+        },
+        "actuation": (
+            {"desired": coordinator.actuation.desired, "pending": sorted(coordinator.actuation.pending)}
+            if coordinator.actuation
+            else None
+        ),
         "system_info": {
             "domain": DOMAIN,
         },
@@ -0,0 +1,101 @@
+"""Room proposals from the area, device and entity registries."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
+
+from .const import (
+    CONF_AREA_ID,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_SENSOR,
+    CONF_CONTACT_SENSORS,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+    CONF_SURFACE_SENSORS,
+    DEFAULT_CEILING_HEIGHT,
+    DOMAIN,
+)
+from .fusion import as_entity_list
+
+# (entity domain, device class) of every source a room can use, and the room key it fills.
+_SOURCES = {
+    ("sensor", "temperature"): CONF_INDOOR_TEMP,
+    ("sensor", "humidity"): CONF_INDOOR_HUMIDITY,
+    ("sensor", "carbon_dioxide"): CONF_CO2_SENSOR,
+    ("binary_sensor", "window"): CONF_CONTACT_SENSORS,
+    ("binary_sensor", "door"): CONF_CONTACT_SENSORS,
+    ("binary_sensor", "opening"): CONF_CONTACT_SENSORS,
+}
+
+
+@callback
+def async_index_areas(hass: HomeAssistant) -> dict[str, dict[str, list[str]]]:
+    """Group usable source entities by area and room key in a single pass over the entity registry."""
+    devices = dr.async_get(hass)
+    index: dict[str, dict[str, list[str]]] = {}
+    for entry in er.async_get(hass).entities.values():
+        if entry.disabled_by is not None or entry.platform == DOMAIN:
+            continue
+        if (device_class := entry.device_class or entry.original_device_class) is None:
+            continue
+        if (key := _SOURCES.get((entry.domain, device_class))) is None:
+            continue
+        area_id = entry.area_id
+        if area_id is None and entry.device_id and (device := devices.async_get(entry.device_id)):
+            area_id = device.area_id
+        if area_id is not None:
+            index.setdefault(area_id, {}).setdefault(key, []).append(entry.entity_id)
+    return index
+
+
+@callback
+def async_propose_rooms(
+    hass: HomeAssistant, rooms: list[dict[str, Any]], reserved: Iterable[str] = ()
+) -> dict[str, dict[str, Any]]:
+    """Propose a room per area id for every area with temperature and humidity sensors that no room covers yet.
+
+    Sensors in `reserved` (the outdoor sources) and the surface sensors of existing rooms are never
+    proposed as room sources. Floor area is left out; the caller asks for it before the rooms are stored.
+    """
+    used_areas = {room.get(CONF_AREA_ID) for room in rooms}
+    used_names = {room[CONF_ROOM_NAME] for room in rooms}
+    used_entities = {
+        entity_id
+        for room in rooms
+        for key in (CONF_INDOOR_TEMP, CONF_INDOOR_HUMIDITY)
+        for entity_id in as_entity_list(room.get(key))
+    }
+    excluded = {*reserved, *(entity_id for room in rooms for entity_id in room.get(CONF_SURFACE_SENSORS, []))}
+
+    areas = ar.async_get(hass)
+    proposals = {}
+    for area_id, area_sources in async_index_areas(hass).items():
+        sources = {
+            key: kept
+            for key, entity_ids in area_sources.items()
+            if (kept := [entity_id for entity_id in entity_ids if entity_id not in excluded])
+        }
+        if CONF_INDOOR_TEMP not in sources or CONF_INDOOR_HUMIDITY not in sources or area_id in used_areas:
+            continue
+        if (area := areas.async_get_area(area_id)) is None or area.name in used_names:
+            continue
+        if used_entities.intersection(sources[CONF_INDOOR_TEMP] + sources[CONF_INDOOR_HUMIDITY]):
+            continue
+        room = {
+            CONF_ROOM_NAME: area.name,
+            CONF_AREA_ID: area_id,
+            CONF_CEILING_HEIGHT: DEFAULT_CEILING_HEIGHT,
+            CONF_INDOOR_TEMP: sorted(sources[CONF_INDOOR_TEMP]),
+            CONF_INDOOR_HUMIDITY: sorted(sources[CONF_INDOOR_HUMIDITY]),
+        }
+        if co2 := sources.get(CONF_CO2_SENSOR):
+            room[CONF_CO2_SENSOR] = min(co2)
+        if contacts := sources.get(CONF_CONTACT_SENSORS):
+            room[CONF_CONTACT_SENSORS] = sorted(contacts)
+        proposals[area_id] = room
+    return dict(sorted(proposals.items(), key=lambda item: item[1][CONF_ROOM_NAME]))
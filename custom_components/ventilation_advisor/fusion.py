@@ -0,0 +1,68 @@
+"""Weighted fusion of several sensors measuring the same room quantity."""
+
+from __future__ import annotations
+
+from .const import FUSION_STALE_AFTER
+
+
+def as_entity_list(value: str | list[str] | None) -> list[str]:
+    """Normalize a single-entity or multi-entity room option into a list."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class FusedSource:
+    """Weighted mean of several members, updated incrementally for the member that changed."""
+
+    __slots__ = ("_sum", "_updated", "_values", "_weight", "_weights")
+
+    def __init__(self, weights: dict[str, float]) -> None:
+        """Initialize with the weight of every member."""
+        self._weights = weights
+        self._values: dict[str, float] = {}
+        self._updated: dict[str, float] = {}
+        self._sum = 0.0
+        self._weight = 0.0
+
+    @property
+    def members(self) -> list[str]:
+        """Return the member entity ids."""
+        return list(self._weights)
+
+    def update(self, entity_id: str, value: float | None, timestamp: float, now: float) -> None:
+        """Replace one member's contribution; invalid or stale readings drop the member."""
+        weight = self._weights[entity_id]
+        if (old := self._values.pop(entity_id, None)) is not None:
+            self._sum -= weight * old
+            self._weight -= weight
+            del self._updated[entity_id]
+
+        if value is None or (len(self._weights) > 1 and timestamp < now - FUSION_STALE_AFTER):
+            if not self._values:
+                # Clear accumulated rounding error once the group is empty.
+                self._sum = self._weight = 0.0
+            return
+
+        self._values[entity_id] = value
+        self._updated[entity_id] = timestamp
+        self._sum += weight * value
+        self._weight += weight
+
+    def stale_members(self, now: float) -> list[str]:
+        """Return members that have not reported for too long; single-sensor groups never go stale."""
+        if len(self._weights) < 2:
+            return []
+        cutoff = now - FUSION_STALE_AFTER
+        return [entity_id for entity_id, updated in self._updated.items() if updated < cutoff]
+
+    @property
+    def value(self) -> float | None:
+        """Return the fused value, or None when no member is valid."""
+        if self._weight <= 0:
+            return None
+        if len(self._values) == 1:
+            return next(iter(self._values.values()))
+        return round(self._sum / self._weight, 2)
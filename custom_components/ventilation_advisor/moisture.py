@@ -0,0 +1,73 @@
+"""Streaming detection of moisture events (showers, cooking) from indoor absolute humidity."""
+
+from __future__ import annotations
+
+import math
+
+from .const import MOISTURE_BASELINE_TAU, MOISTURE_DRIFT, MOISTURE_MAX_DURATION, MOISTURE_MAX_STEP, MOISTURE_THRESHOLD
+
+EVENT_STARTED = "started"
+EVENT_ENDED = "ended"
+
+
+class MoistureEventDetector:
+    """One-sided CUSUM on absolute humidity above a slowly adapting baseline, in constant memory.
+
+    The cumulative sum is time-weighted (g/m³ x minutes) so the detector behaves the same for
+    sensors reporting every few seconds or every few minutes. Each sample's excess is held until the
+    next sample arrives, so a single reading after a long gap cannot start an event on its own.
+    While no event is active the baseline follows the humidity as an exponential moving average;
+    during an event it is frozen, so the rise above it estimates the water added to the room air.
+    """
+
+    __slots__ = ("_excess", "_last", "active", "added_water", "baseline", "cusum", "peak", "started")
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.baseline: float | None = None
+        self.cusum = 0.0
+        self.active = False
+        self.started: float | None = None
+        self.peak = 0.0
+        self.added_water: float | None = None
+        self._last: float | None = None
+        self._excess = 0.0
+
+    def update(self, timestamp: float, ah: float, volume: float) -> str | None:
+        """Feed one sample; return EVENT_STARTED or EVENT_ENDED on a transition."""
+        if self.baseline is None or self._last is None:
+            self.baseline = ah
+            self._last = timestamp
+            self._excess = 0.0
+            return None
+
+        minutes = min(max(timestamp - self._last, 0.0), MOISTURE_MAX_STEP) / 60
+        self._last = timestamp
+        excess = ah - self.baseline
+        held, self._excess = self._excess, excess
+
+        if self.active:
+            assert self.started is not None
+            self.peak = max(self.peak, ah)
+            self.added_water = round((self.peak - self.baseline) * volume, 0)
+            if excess <= MOISTURE_DRIFT or timestamp - self.started > MOISTURE_MAX_DURATION:
+                self.active = False
+                self.cusum = 0.0
+                # Restart the baseline from the current level after a timed-out event.
+                self.baseline = min(self.baseline, ah) if excess <= MOISTURE_DRIFT else ah
+                self._excess = ah - self.baseline
+                return EVENT_ENDED
+            return None
+
+        # Hold the previous excess over the elapsed interval.
+        self.cusum = max(0.0, self.cusum + (held - MOISTURE_DRIFT) * minutes)
+        if self.cusum > MOISTURE_THRESHOLD:
+            self.active = True
+            self.started = timestamp
+            self.peak = ah
+            self.added_water = round(excess * volume, 0)
+            return EVENT_STARTED
+
+        alpha = 1 - math.exp(-minutes * 60 / MOISTURE_BASELINE_TAU)
+        self.baseline += alpha * excess
+        return None
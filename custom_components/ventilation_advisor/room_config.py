@@ -0,0 +1,215 @@
+"""Validation, import and export of room configurations as one document."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from voluptuous.humanize import humanize_error
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import yaml as yaml_util
+from homeassistant.util.json import JsonObjectType
+
+from .const import (
+    CONF_ACTUATORS,
+    CONF_AREA_ID,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_CRITICAL_OVERRIDE,
+    CONF_CO2_SENSOR,
+    CONF_CO2_WARN_OVERRIDE,
+    CONF_CONTACT_SENSORS,
+    CONF_EXPOSED_METRICS,
+    CONF_FLOOR_AREA,
+    CONF_HAS_SLOPE,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    CONF_SENSOR_WEIGHTS,
+    CONF_SLOPE_A,
+    CONF_SLOPE_B,
+    CONF_SLOPE_C,
+    CONF_STRATEGY,
+    CONF_SURFACE_SENSORS,
+    DEFAULT_CEILING_HEIGHT,
+    METRIC_AIR_CHANGE_RATE,
+    METRIC_CONDENSATION_MARGIN,
+    METRIC_LAST_SESSION,
+    ROOM_METRICS,
+    STRATEGY_OPTIONS,
+)
+from .fusion import as_entity_list
+
+
+def _number(minimum: float, maximum: float | None = None) -> vol.All:
+    return vol.All(vol.Coerce(float), vol.Range(min=minimum, max=maximum))
+
+
+_SLOPE = _number(0.1, 100)
+
+# Same keys and limits as the room steps of the options flow.
+ROOM_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ROOM_NAME): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional(CONF_AREA_ID): vol.Any(None, cv.string),
+        vol.Required(CONF_FLOOR_AREA): _number(1, 1000),
+        vol.Optional(CONF_CEILING_HEIGHT, default=DEFAULT_CEILING_HEIGHT): _number(1, 10),
+        vol.Optional(CONF_HAS_SLOPE, default=False): cv.boolean,
+        vol.Optional(CONF_SLOPE_A): _SLOPE,
+        vol.Optional(CONF_SLOPE_B): _SLOPE,
+        vol.Optional(CONF_SLOPE_C): _SLOPE,
+        vol.Required(CONF_INDOOR_TEMP): vol.All(cv.entity_ids, vol.Length(min=1)),
+        vol.Required(CONF_INDOOR_HUMIDITY): vol.All(cv.entity_ids, vol.Length(min=1)),
+        vol.Optional(CONF_CO2_SENSOR): vol.Any(None, cv.entity_id),
+        vol.Optional(CONF_CONTACT_SENSORS): cv.entity_ids,
+        vol.Optional(CONF_SURFACE_SENSORS): cv.entity_ids,
+        vol.Optional(CONF_ACTUATORS): vol.All(cv.entity_ids, [cv.entity_domain(["fan", "humidifier", "switch"])]),
+        vol.Optional(CONF_MIN_ON_TIME): _number(0, 240),
+        vol.Optional(CONF_MIN_OFF_TIME): _number(0, 240),
+        vol.Optional(CONF_SENSOR_WEIGHTS): {cv.entity_id: _number(0.1, 10)},
+        vol.Optional(CONF_STRATEGY): vol.In(STRATEGY_OPTIONS),
+        vol.Optional(CONF_MOULD_SAFE_OVERRIDE): _number(0, 100),
+        vol.Optional(CONF_MOULD_CRITICAL_OVERRIDE): _number(0, 100),
+        vol.Optional(CONF_CO2_WARN_OVERRIDE): _number(0),
+        vol.Optional(CONF_CO2_CRITICAL_OVERRIDE): _number(0),
+        vol.Optional(CONF_EXPOSED_METRICS): [vol.In(ROOM_METRICS)],
+    }
+)
+
+
+# Override pairs whose lower value must stay below the upper one.
+_ORDERED_THRESHOLDS = (
+    (CONF_MOULD_SAFE_OVERRIDE, CONF_MOULD_CRITICAL_OVERRIDE),
+    (CONF_CO2_WARN_OVERRIDE, CONF_CO2_CRITICAL_OVERRIDE),
+)
+
+
+class RoomImportError(HomeAssistantError):
+    """Raised when a room document cannot be parsed or contains invalid rooms."""
+
+
+def unordered_thresholds(room: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return the (lower, upper) override pairs whose lower value is not below the upper one."""
+    return [
+        (lower, upper)
+        for lower, upper in _ORDERED_THRESHOLDS
+        if room.get(lower) is not None and room.get(upper) is not None and room[lower] >= room[upper]
+    ]
+
+
+def _check_room(room: dict[str, Any]) -> None:
+    """Validate constraints spanning several keys of one room."""
+    if room[CONF_HAS_SLOPE] and any(key not in room for key in (CONF_SLOPE_A, CONF_SLOPE_B, CONF_SLOPE_C)):
+        raise vol.Invalid(f"{CONF_HAS_SLOPE} requires {CONF_SLOPE_A}, {CONF_SLOPE_B} and {CONF_SLOPE_C}")
+    if unordered := unordered_thresholds(room):
+        lower, upper = unordered[0]
+        raise vol.Invalid(f"{lower} must be below {upper}")
+    members = set(room[CONF_INDOOR_TEMP]) | set(room[CONF_INDOOR_HUMIDITY])
+    if unknown := set(room.get(CONF_SENSOR_WEIGHTS, {})) - members:
+        raise vol.Invalid(f"{CONF_SENSOR_WEIGHTS} lists sensors not used by the room: {', '.join(sorted(unknown))}")
+
+
+def validate_rooms(rooms: Any) -> list[dict[str, Any]]:
+    """Validate every room of a document and report all problems at once."""
+    if isinstance(rooms, dict) and CONF_ROOMS in rooms:
+        rooms = rooms[CONF_ROOMS]
+    if not isinstance(rooms, list) or not rooms:
+        raise RoomImportError("Expected a non-empty list of rooms")
+
+    validated = []
+    errors = []
+    names: set[str] = set()
+    for index, room in enumerate(rooms):
+        label = f"rooms[{index}]"
+        if isinstance(room, dict) and room.get(CONF_ROOM_NAME):
+            label = f"{label} ({room[CONF_ROOM_NAME]})"
+        try:
+            checked: dict[str, Any] = ROOM_SCHEMA(room)
+            _check_room(checked)
+        except vol.Invalid as err:
+            message = humanize_error(room, err) if isinstance(room, dict) else str(err)
+            errors.append(f"{label}: {message}")
+            continue
+        if checked[CONF_ROOM_NAME] in names:
+            errors.append(f"{label}: duplicate room name")
+            continue
+        names.add(checked[CONF_ROOM_NAME])
+        validated.append(checked)
+
+    if errors:
+        raise RoomImportError("\n".join(errors))
+    return validated
+
+
+def parse_rooms_document(document: str) -> list[dict[str, Any]]:
+    """Parse and validate a YAML or JSON room document."""
+    try:
+        data = yaml_util.parse_yaml(document)
+    except HomeAssistantError as err:
+        raise RoomImportError(f"Invalid YAML/JSON: {err}") from err
+    return validate_rooms(data)
+
+
+def room_metrics(room: dict[str, Any], compact: bool) -> list[str]:
+    """Return the metrics that get their own entities, skipping those without a configured source."""
+    metrics = room.get(CONF_EXPOSED_METRICS, []) if compact else ROOM_METRICS
+    if not room.get(CONF_CO2_SENSOR):
+        metrics = [metric for metric in metrics if metric != METRIC_AIR_CHANGE_RATE]
+    if not room.get(CONF_CONTACT_SENSORS):
+        metrics = [metric for metric in metrics if metric != METRIC_LAST_SESSION]
+    if not room.get(CONF_SURFACE_SENSORS):
+        metrics = [metric for metric in metrics if metric != METRIC_CONDENSATION_MARGIN]
+    return metrics
+
+
+def new_room_id(rooms: list[dict[str, Any]]) -> str:
+    """Return a room id not used by any of `rooms`."""
+    used = {room.get("id") for room in rooms}
+    candidate = len(rooms)
+    while str(candidate) in used:
+        candidate += 1
+    return str(candidate)
+
+
+def merge_rooms(
+    existing: list[dict[str, Any]], imported: list[dict[str, Any]], replace: bool = False
+) -> list[dict[str, Any]]:
+    """Apply imported rooms by name; unmatched existing rooms are kept unless `replace` is set."""
+    incoming = {room[CONF_ROOM_NAME]: dict(room) for room in imported}
+    merged = []
+    for room in existing:
+        if (update := incoming.pop(room[CONF_ROOM_NAME], None)) is not None:
+            # Keep the id of a matched room so its entities keep their unique ids.
+            if "id" in room:
+                update["id"] = room["id"]
+            merged.append(update)
+        elif not replace:
+            merged.append(room)
+
+    for room in incoming.values():
+        room["id"] = new_room_id([*existing, *merged])
+        merged.append(room)
+    return merged
+
+
+def export_rooms(rooms: list[dict[str, Any]]) -> list[JsonObjectType]:
+    """Return rooms without installation-specific ids, ready to import elsewhere."""
+    exported: list[JsonObjectType] = []
+    for room in rooms:
+        cleaned = {key: value for key, value in room.items() if key != "id" and value not in (None, [], {})}
+        for key in (CONF_INDOOR_TEMP, CONF_INDOOR_HUMIDITY):
+            if key in cleaned:
+                cleaned[key] = as_entity_list(cleaned[key])
+        exported.append(cleaned)
+    return exported
+
+
+def dump_rooms(rooms: list[dict[str, Any]]) -> str:
+    """Serialize rooms as a YAML document."""
+    return yaml_util.dump({CONF_ROOMS: export_rooms(rooms)})
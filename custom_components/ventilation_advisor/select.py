@@ -7,7 +7,16 @@
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_ROOM_NAME, CONF_ROOMS, CONF_STRATEGY, DEFAULT_STRATEGY, DOMAIN, STRATEGY_OPTIONS
+from .const import (
+    CONF_COMPACT_MODE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    CONF_STRATEGY,
+    DEFAULT_COMPACT_MODE,
+    DEFAULT_STRATEGY,
+    DOMAIN,
+    STRATEGY_OPTIONS,
+)
 
 
 async def async_setup_entry(
@@ -21,10 +30,12 @@ async def async_setup_entry(
     # Global strategy
     entities.append(VentilationStrategySelect(entry))
 
-    # Per-room strategy
-    rooms = entry.options.get(CONF_ROOMS, [])
-    entities.extend(RoomStrategySelect(entry, room) for room in rooms)
+    # Per-room strategy (set through the room options in compact mode)
+    if not entry.options.get(CONF_COMPACT_MODE, DEFAULT_COMPACT_MODE):
+        rooms = entry.options.get(CONF_ROOMS, [])
+        entities.extend(RoomStrategySelect(entry, room) for room in rooms)
 
+    entry.runtime_data.unique_ids.update(entity.unique_id for entity in entities)
     async_add_entities(entities)
 
 
@@ -2,68 +2,36 @@
 
 from __future__ import annotations
 
-import math
-
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
-    CO2_CRITICAL,
-    CO2_WARN,
     CONF_AREA_ID,
-    CONF_CEILING_HEIGHT,
-    CONF_CO2_CRITICAL_OVERRIDE,
-    CONF_CO2_SENSOR,
-    CONF_CO2_WARN_OVERRIDE,
-    CONF_FLOOR_AREA,
-    CONF_HAS_SLOPE,
-    CONF_INDOOR_HUMIDITY,
-    CONF_INDOOR_TEMP,
-    CONF_MOULD_CRITICAL_OVERRIDE,
-    CONF_MOULD_SAFE_OVERRIDE,
-    CONF_OUTDOOR_HUMIDITY,
-    CONF_OUTDOOR_TEMP,
+    CONF_COMPACT_MODE,
     CONF_ROOM_NAME,
     CONF_ROOMS,
-    CONF_SLOPE_A,
-    CONF_SLOPE_B,
-    CONF_SLOPE_C,
-    CONF_STRATEGY,
-    DEFAULT_STRATEGY,
+    CONF_SURFACE_SENSORS,
+    DEFAULT_COMPACT_MODE,
     DOMAIN,
-    MAGNUS_A,
-    MAGNUS_B,
-    MAGNUS_C,
-    MAGNUS_K,
-    MOULD_RISK_CRITICAL,
-    MOULD_RISK_SAFE,
-    STRATEGY_AGGRESSIVE,
-    STRATEGY_ENERGY_SAVER,
-    STRATEGY_FRESH_AIR,
+    METRIC_AIR_CHANGE_RATE,
+    METRIC_CONDENSATION_MARGIN,
+    METRIC_DRYING_POTENTIAL,
+    METRIC_EFFICIENCY,
+    METRIC_HUMIDITY_TREND,
+    METRIC_INDOOR_AH,
+    METRIC_LAST_SESSION,
+    METRIC_MOISTURE_EVENT,
+    METRIC_MOULD_RISK,
+    METRIC_TREND,
+    METRIC_VOLUME,
+    METRIC_WATER_CONTENT,
+    METRIC_WATER_TREND,
 )
-
-
-def calculate_absolute_humidity(temperature: float, humidity: float) -> float:
-    """Calculate absolute humidity in g/m³ using the Magnus Formula."""
-    t = temperature
-    rh = humidity
-
-    # Saturation Vapor Pressure (hPa)
-    if (t + MAGNUS_C) == 0:
-        return 0.0
-
-    p_sat = MAGNUS_A * math.exp((MAGNUS_B * t) / (t + MAGNUS_C))
-
-    # Actual Vapor Pressure (hPa)
-    p_act = p_sat * (rh / 100.0)
-
-    # Absolute Humidity (g/m³)
-    ah = 216.7 * (p_act / (MAGNUS_K + t))
-
-    return round(ah, 2)
+from .coordinator import SYSTEM_KEY
+from .data import Advice, Efficiency, RoomResult
+from .room_config import room_metrics
 
 
 async def async_setup_entry(
@@ -73,23 +41,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     rooms = entry.options.get(CONF_ROOMS, [])
-    entities = []
+    compact = entry.options.get(CONF_COMPACT_MODE, DEFAULT_COMPACT_MODE)
+    entities: list[VentilationSensorBase] = []
 
     entities.append(GlobalOutdoorAHSensor(entry))
 
     for room in rooms:
+        entities.append(MasterAdviceSensor(entry, room, compact))
         entities.extend(
-            [
-                WaterContentSensor(entry, room),
-                IndoorAHSensor(entry, room),
-                MouldRiskSensor(entry, room),
-                DryingPotentialSensor(entry, room),
-                VentilationEfficiencySensor(entry, room),
-                MasterAdviceSensor(entry, room),
-                RoomVolumeSensor(entry, room),
-            ]
+            sensor_class(entry, room)
+            for metric in room_metrics(room, compact)
+            for sensor_class in METRIC_SENSORS[metric]
         )
 
+    entry.runtime_data.unique_ids.update(entity.unique_id for entity in entities)
     async_add_entities(entities)
 
 
@@ -97,19 +62,22 @@ class VentilationSensorBase(SensorEntity):
     """Base class with common logic."""
 
     _attr_should_poll = False
+    # Metrics that follow every source tick; downsampled in statistics mode.
+    _high_frequency = False
 
     def __init__(self, entry: ConfigEntry, room: dict | None = None):
         """Initialize the sensor."""
         self._entry = entry
+        self._coordinator = entry.runtime_data.coordinator
         self._room = room
-        if room:
-            self._room_id = room.get("id", room[CONF_ROOM_NAME])
+        self._room_id = room.get("id", room[CONF_ROOM_NAME]) if room else SYSTEM_KEY
+        if self._high_frequency and self._coordinator.statistics:
+            # Long-term statistics are published by the coordinator instead of the recorder.
+            self._attr_state_class = None
 
     async def async_added_to_hass(self):
-        """Register callbacks."""
-        entity_ids = self._get_listening_entities()
-        self.async_on_remove(async_track_state_change_event(self.hass, entity_ids, self._async_update_event))
-        self._async_update_event()
+        """Register with the coordinator; states are written after each evaluation pass."""
+        self.async_on_remove(self._coordinator.async_add_listener(self._room_id, self, self._high_frequency))
 
     @property
     def device_info(self):
@@ -131,31 +99,9 @@ def device_info(self):
 
         return info
 
-    @callback
-    def _async_update_event(self, event=None):
-        self.async_schedule_update_ha_state(True)
-
-    def _get_listening_entities(self):
-        ids = [
-            self._entry.data[CONF_OUTDOOR_TEMP],
-            self._entry.data[CONF_OUTDOOR_HUMIDITY],
-        ]
-        if room := self._room:
-            ids.extend([room[CONF_INDOOR_TEMP], room[CONF_INDOOR_HUMIDITY]])
-            if room.get(CONF_CO2_SENSOR):
-                ids.append(room[CONF_CO2_SENSOR])
-        return ids
-
-    def _get_float_state(self, entity_id):
-        if not entity_id:
-            return None
-        state = self.hass.states.get(entity_id)
-        if state and state.state not in ("unknown", "unavailable"):
-            try:
-                return float(state.state)
-            except ValueError:
-                pass
-        return None
+    @property
+    def _result(self) -> RoomResult | None:
+        return self._coordinator.results.get(self._room_id)
 
 
 class GlobalOutdoorAHSensor(VentilationSensorBase):
@@ -164,6 +110,7 @@ class GlobalOutdoorAHSensor(VentilationSensorBase):
     _attr_icon = "mdi:water"
     _attr_native_unit_of_measurement = "g/m³"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _high_frequency = True
 
     def __init__(self, entry):
         """Initialize outdoor humidity sensor."""
@@ -184,9 +131,7 @@ def device_info(self):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        t = self._get_float_state(self._entry.data[CONF_OUTDOOR_TEMP])
-        h = self._get_float_state(self._entry.data[CONF_OUTDOOR_HUMIDITY])
-        return calculate_absolute_humidity(t, h) if t is not None and h is not None else None
+        return self._coordinator.outdoor_ah
 
 
 class IndoorAHSensor(VentilationSensorBase):
@@ -195,6 +140,7 @@ class IndoorAHSensor(VentilationSensorBase):
     _attr_icon = "mdi:water"
     _attr_native_unit_of_measurement = "g/m³"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _high_frequency = True
 
     def __init__(self, entry: ConfigEntry, room: dict):
         """Initialize indoor humidity sensor."""
@@ -205,11 +151,7 @@ def __init__(self, entry: ConfigEntry, room: dict):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return None
-        t = self._get_float_state(room[CONF_INDOOR_TEMP])
-        h = self._get_float_state(room[CONF_INDOOR_HUMIDITY])
-        return calculate_absolute_humidity(t, h) if t is not None and h is not None else None
+        return result.indoor_ah if (result := self._result) else None
 
 
 class WaterContentSensor(VentilationSensorBase):
@@ -218,6 +160,7 @@ class WaterContentSensor(VentilationSensorBase):
     _attr_icon = "mdi:water-percent"
     _attr_native_unit_of_measurement = "ml"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _high_frequency = True
 
     def __init__(self, entry: ConfigEntry, room: dict):
         """Initialize water content sensor."""
@@ -228,21 +171,7 @@ def __init__(self, entry: ConfigEntry, room: dict):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return None
-        t = self._get_float_state(room[CONF_INDOOR_TEMP])
-        h = self._get_float_state(room[CONF_INDOOR_HUMIDITY])
-        if t is not None and h is not None:
-            ah = calculate_absolute_humidity(t, h)
-            volume = room[CONF_FLOOR_AREA] * room[CONF_CEILING_HEIGHT]
-
-            # Substract sloping roof volume if configured
-            if room.get(CONF_HAS_SLOPE):
-                v_slope = 0.5 * room.get(CONF_SLOPE_A, 0) * room.get(CONF_SLOPE_B, 0) * room.get(CONF_SLOPE_C, 0)
-                volume = max(0, volume - v_slope)
-
-            return round(ah * volume, 1)
-        return None
+        return result.water_content if (result := self._result) else None
 
 
 class MouldRiskSensor(VentilationSensorBase):
@@ -261,22 +190,7 @@ def __init__(self, entry: ConfigEntry, room: dict):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return None
-        rh = self._get_float_state(room[CONF_INDOOR_HUMIDITY])
-        if rh is None:
-            return None
-
-        safe = room.get(CONF_MOULD_SAFE_OVERRIDE, MOULD_RISK_SAFE)
-        critical = room.get(CONF_MOULD_CRITICAL_OVERRIDE, MOULD_RISK_CRITICAL)
-
-        if rh < safe:
-            return 0.0
-        if rh >= critical:
-            return 100.0
-
-        score = (rh - safe) * (100 / (critical - safe))
-        return round(score, 0)
+        return result.mould_risk if (result := self._result) else None
 
 
 class DryingPotentialSensor(VentilationSensorBase):
@@ -285,6 +199,7 @@ class DryingPotentialSensor(VentilationSensorBase):
     _attr_icon = "mdi:weather-windy"
     _attr_native_unit_of_measurement = "g/m³"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _high_frequency = True
 
     def __init__(self, entry: ConfigEntry, room: dict):
         """Initialize drying potential sensor."""
@@ -295,17 +210,7 @@ def __init__(self, entry: ConfigEntry, room: dict):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return None
-        i_t = self._get_float_state(room[CONF_INDOOR_TEMP])
-        i_h = self._get_float_state(room[CONF_INDOOR_HUMIDITY])
-        o_t = self._get_float_state(self._entry.data[CONF_OUTDOOR_TEMP])
-        o_h = self._get_float_state(self._entry.data[CONF_OUTDOOR_HUMIDITY])
-        if i_t is None or i_h is None or o_t is None or o_h is None:
-            return None
-        i_ah = calculate_absolute_humidity(i_t, i_h)
-        o_ah = calculate_absolute_humidity(o_t, o_h)
-        return round(i_ah - o_ah, 2)
+        return result.drying_potential if (result := self._result) else None
 
 
 class VentilationEfficiencySensor(VentilationSensorBase):
@@ -322,35 +227,7 @@ def __init__(self, entry: ConfigEntry, room: dict):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return "Unknown"
-        i_t = self._get_float_state(room[CONF_INDOOR_TEMP])
-        o_t = self._get_float_state(self._entry.data[CONF_OUTDOOR_TEMP])
-        i_h = self._get_float_state(room[CONF_INDOOR_HUMIDITY])
-        o_h = self._get_float_state(self._entry.data[CONF_OUTDOOR_HUMIDITY])
-
-        if i_t is None or o_t is None or i_h is None or o_h is None:
-            return "Unknown"
-
-        dp = calculate_absolute_humidity(i_t, i_h) - calculate_absolute_humidity(o_t, o_h)
-        if dp <= 0:
-            return "Counter-Productive"
-
-        dt = i_t - o_t
-        if dt <= 0:
-            return "High (Free Cooling)"
-
-        penalty_factor = 1.0
-        if i_h > 40:
-            penalty_factor = 1 + ((i_h - 40) * 0.005)
-
-        effective_cost = dt * penalty_factor
-        ratio = dp / effective_cost
-        if ratio > 0.3:
-            return "High"
-        if ratio > 0.1:
-            return "Medium"
-        return "Low (Wasteful)"
+        return (result.efficiency if (result := self._result) else Efficiency.UNKNOWN).label
 
 
 class MasterAdviceSensor(VentilationSensorBase):
@@ -358,91 +235,219 @@ class MasterAdviceSensor(VentilationSensorBase):
 
     _attr_icon = "mdi:window-open-variant"
 
-    def __init__(self, entry: ConfigEntry, room: dict):
+    def __init__(self, entry: ConfigEntry, room: dict, compact: bool = False):
         """Initialize master advice sensor."""
         super().__init__(entry, room)
         self._attr_name = f"{room[CONF_ROOM_NAME]} Master Advice"
         self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_master_advice"
+        self._compact = compact
+        self._has_surfaces = bool(room.get(CONF_SURFACE_SENSORS))
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not (room := self._room):
-            return "Unknown"
+        return (result.advice if (result := self._result) else Advice.UNKNOWN).label
 
-        risk_sensor = MouldRiskSensor(self._entry, room)
-        risk_sensor.hass = self.hass
-        risk_val = risk_sensor.native_value
+    @property
+    def extra_state_attributes(self):
+        """In compact mode, carry every room metric so one state write covers the whole room."""
+        if not self._compact:
+            return None
 
-        power_sensor = DryingPotentialSensor(self._entry, room)
-        power_sensor.hass = self.hass
-        power_val = power_sensor.native_value
+        result = self._result
+        attributes = {
+            METRIC_INDOOR_AH: result.indoor_ah if result else None,
+            METRIC_WATER_CONTENT: result.water_content if result else None,
+            METRIC_MOULD_RISK: result.mould_risk if result else None,
+            METRIC_DRYING_POTENTIAL: result.drying_potential if result else None,
+            METRIC_EFFICIENCY: (result.efficiency if result else Efficiency.UNKNOWN).label,
+            METRIC_VOLUME: round(self._coordinator.rules[self._room_id].volume, 2),
+            METRIC_HUMIDITY_TREND: result.humidity_trend if result else None,
+            METRIC_WATER_TREND: result.water_trend if result else None,
+            METRIC_MOISTURE_EVENT: result.moisture_event if result else False,
+        }
+        if self._has_surfaces:
+            attributes[METRIC_CONDENSATION_MARGIN] = result.condensation_margin if result else None
+        if estimator := self._coordinator.air_change.get(self._room_id):
+            attributes[METRIC_AIR_CHANGE_RATE] = estimator.learned_ach
+        if (tracker := self._coordinator.sessions.get(self._room_id)) and (session := tracker.last):
+            attributes[METRIC_LAST_SESSION] = session.as_dict()
+        return attributes
 
-        eff_sensor = VentilationEfficiencySensor(self._entry, room)
-        eff_sensor.hass = self.hass
-        eff_val = eff_sensor.native_value
 
-        co2_val = self._get_float_state(room.get(CONF_CO2_SENSOR))
+class RoomVolumeSensor(VentilationSensorBase):
+    """Room Volume (Diagnostic)."""
 
-        if risk_val is None or power_val is None or eff_val == "Unknown" or eff_val is None:
-            return "Unknown"
+    _attr_icon = "mdi:cube-outline"
+    _attr_native_unit_of_measurement = "m³"
+    _attr_entity_category = "diagnostic"
 
-        # Overrides
-        c_warn = room.get(CONF_CO2_WARN_OVERRIDE, CO2_WARN)
-        c_crit = room.get(CONF_CO2_CRITICAL_OVERRIDE, CO2_CRITICAL)
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Calculated Volume"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_volume"
 
-        if risk_val >= 80:
-            return "Urgent (Mould Risk)"
+    async def async_added_to_hass(self):
+        """Geometry is static, so there is nothing to listen to."""
 
-        if co2_val is not None and co2_val >= c_crit:
-            return "Urgent (Air Quality)"
+    @property
+    def native_value(self):
+        """Return volume."""
+        return round(self._coordinator.rules[self._room_id].volume, 2)
 
-        if power_val <= 0:
-            if co2_val and co2_val >= c_warn:
-                return "Recommended (Fresh Air)"
-            return "Hold (Ineffective)"
 
-        strategy = room.get(CONF_STRATEGY, self._entry.options.get(CONF_STRATEGY, DEFAULT_STRATEGY))
+class AirChangeRateSensor(VentilationSensorBase):
+    """Air Change Rate learned from CO2 decay (ACH)."""
 
-        if strategy == STRATEGY_ENERGY_SAVER:
-            if eff_val.startswith("High"):
-                return "Optional (Efficient)"
-            return "Hold (Eco Mode)"
+    _attr_icon = "mdi:home-import-outline"
+    _attr_native_unit_of_measurement = "1/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
-        if strategy == STRATEGY_AGGRESSIVE:
-            return "Recommended (Drying)"
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize air change rate sensor."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Air Change Rate"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_air_change_rate"
+        self._estimator = self._coordinator.air_change[self._room_id]
 
-        is_fresh_air_lover = strategy == STRATEGY_FRESH_AIR
-        if risk_val > (30 if is_fresh_air_lover else 50):
-            return "Recommended"
-        if power_val > (1.0 if is_fresh_air_lover else 2.0):
-            return "Recommended (Quick)"
-        if eff_val.startswith("High"):
-            return "Optional (Efficient)"
+    @property
+    def native_value(self):
+        """Return the learned air changes per hour."""
+        return self._estimator.learned_ach
 
-        return "Hold (Low Necessity)"
+    @property
+    def extra_state_attributes(self):
+        """Return details of the last decay episode."""
+        return {
+            "last_episode_ach": self._estimator.last_episode_ach,
+            "last_episode": self._estimator.last_episode,
+            "episodes": self._estimator.episodes,
+        }
 
 
-class RoomVolumeSensor(VentilationSensorBase):
-    """Room Volume (Diagnostic)."""
+class LastSessionWaterRemovedSensor(VentilationSensorBase):
+    """Water removed during the last ventilation session (g)."""
 
-    _attr_icon = "mdi:cube-outline"
-    _attr_native_unit_of_measurement = "m³"
-    _attr_entity_category = "diagnostic"
+    _attr_icon = "mdi:water-minus"
+    _attr_native_unit_of_measurement = "g"
 
     def __init__(self, entry: ConfigEntry, room: dict):
-        """Initialize."""
+        """Initialize last session water sensor."""
         super().__init__(entry, room)
-        self._attr_name = f"{room[CONF_ROOM_NAME]} Calculated Volume"
-        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_volume"
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Last Session Water Removed"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_session_water"
+        self._tracker = self._coordinator.sessions[self._room_id]
 
     @property
     def native_value(self):
-        """Return volume."""
-        if not (room := self._room):
-            return None
-        volume = room[CONF_FLOOR_AREA] * room[CONF_CEILING_HEIGHT]
-        if room.get(CONF_HAS_SLOPE):
-            v_slope = 0.5 * room.get(CONF_SLOPE_A, 0) * room.get(CONF_SLOPE_B, 0) * room.get(CONF_SLOPE_C, 0)
-            volume = max(0, volume - v_slope)
-        return round(volume, 2)
+        """Return grams of water removed."""
+        return session.water_removed if (session := self._tracker.last) else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the full summary of the last session."""
+        return session.as_dict() if (session := self._tracker.last) else None
+
+
+class LastSessionTemperatureDropSensor(VentilationSensorBase):
+    """Indoor temperature drop during the last ventilation session (°C)."""
+
+    _attr_icon = "mdi:thermometer-minus"
+    _attr_native_unit_of_measurement = "°C"
+
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize last session temperature sensor."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Last Session Temperature Drop"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_session_temp_drop"
+        self._tracker = self._coordinator.sessions[self._room_id]
+
+    @property
+    def native_value(self):
+        """Return the temperature drop."""
+        return session.temperature_drop if (session := self._tracker.last) else None
+
+
+class HumidityTrendSensor(VentilationSensorBase):
+    """Rate of change of indoor absolute humidity (g/m³ per hour)."""
+
+    _attr_icon = "mdi:trending-up"
+    _attr_native_unit_of_measurement = "g/m³/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize humidity trend sensor."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Humidity Trend"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_humidity_trend"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return result.humidity_trend if (result := self._result) else None
+
+
+class WaterContentTrendSensor(VentilationSensorBase):
+    """Rate of change of the water held in the room air (ml per hour)."""
+
+    _attr_icon = "mdi:water-sync"
+    _attr_native_unit_of_measurement = "ml/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize water content trend sensor."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Water Content Trend"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_water_trend"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return result.water_trend if (result := self._result) else None
+
+
+class CondensationMarginSensor(VentilationSensorBase):
+    """Distance of the coldest surface to the dew point (K); condensation at 0 or below."""
+
+    _attr_icon = "mdi:water-thermometer"
+    _attr_native_unit_of_measurement = "K"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, entry: ConfigEntry, room: dict):
+        """Initialize condensation margin sensor."""
+        super().__init__(entry, room)
+        self._attr_name = f"{room[CONF_ROOM_NAME]} Condensation Margin"
+        self._attr_unique_id = f"{entry.entry_id}_{self._room_id}_condensation_margin"
+        self._surfaces = room[CONF_SURFACE_SENSORS]
+
+    @property
+    def native_value(self):
+        """Return the smallest surface margin."""
+        return result.condensation_margin if (result := self._result) else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the dew point and the margin of every surface."""
+        result = self._result
+        margins = result.surface_margins if result else ()
+        return {
+            "dew_point": result.dew_point if result else None,
+            "surfaces": dict(zip(self._surfaces, margins, strict=False)),
+        }
+
+
+# Entities created for each room metric; in compact mode only for the metrics a room exposes.
+METRIC_SENSORS: dict[str, tuple[type[VentilationSensorBase], ...]] = {
+    METRIC_INDOOR_AH: (IndoorAHSensor,),
+    METRIC_WATER_CONTENT: (WaterContentSensor,),
+    METRIC_MOULD_RISK: (MouldRiskSensor,),
+    METRIC_DRYING_POTENTIAL: (DryingPotentialSensor,),
+    METRIC_EFFICIENCY: (VentilationEfficiencySensor,),
+    METRIC_VOLUME: (RoomVolumeSensor,),
+    METRIC_AIR_CHANGE_RATE: (AirChangeRateSensor,),
+    METRIC_LAST_SESSION: (LastSessionWaterRemovedSensor, LastSessionTemperatureDropSensor),
+    METRIC_TREND: (HumidityTrendSensor, WaterContentTrendSensor),
+    METRIC_MOISTURE_EVENT: (),  # Binary sensor platform
+    METRIC_CONDENSATION_MARGIN: (CondensationMarginSensor,),
+}
@@ -0,0 +1,85 @@
+"""Service actions for Ventilation Advisor."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util.json import JsonValueType
+
+from .const import CONF_ROOMS, DOMAIN
+from .room_config import RoomImportError, export_rooms, merge_rooms, parse_rooms_document, validate_rooms
+
+SERVICE_IMPORT_ROOMS = "import_rooms"
+SERVICE_EXPORT_ROOMS = "export_rooms"
+
+ATTR_DOCUMENT = "document"
+ATTR_REPLACE = "replace"
+
+IMPORT_ROOMS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(CONF_ROOMS, "source"): vol.Any(list, dict),
+            vol.Exclusive(ATTR_DOCUMENT, "source"): cv.string,
+            vol.Optional(ATTR_REPLACE, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ROOMS, ATTR_DOCUMENT),
+)
+
+
+def _loaded_entry(hass: HomeAssistant) -> ConfigEntry:
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is ConfigEntryState.LOADED:
+            return entry
+    raise ServiceValidationError(translation_domain=DOMAIN, translation_key="not_loaded")
+
+
+async def _async_import_rooms(call: ServiceCall) -> ServiceResponse:
+    """Validate all rooms together and apply them in a single options update."""
+    entry = _loaded_entry(call.hass)
+    try:
+        if ATTR_DOCUMENT in call.data:
+            imported = parse_rooms_document(call.data[ATTR_DOCUMENT])
+        else:
+            imported = validate_rooms(call.data[CONF_ROOMS])
+    except RoomImportError as err:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_rooms",
+            translation_placeholders={"errors": str(err)},
+        ) from err
+
+    rooms = merge_rooms(entry.options.get(CONF_ROOMS, []), imported, replace=call.data[ATTR_REPLACE])
+    # One options update triggers one reload, which sets up all rooms in a single pass.
+    call.hass.config_entries.async_update_entry(entry, options={**entry.options, CONF_ROOMS: rooms})
+    return {"rooms": len(rooms), "imported": len(imported)}
+
+
+async def _async_export_rooms(call: ServiceCall) -> ServiceResponse:
+    """Return all rooms in the format accepted by `import_rooms`."""
+    entry = _loaded_entry(call.hass)
+    rooms: list[JsonValueType] = list(export_rooms(entry.options.get(CONF_ROOMS, [])))
+    return {CONF_ROOMS: rooms}
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the service actions of the integration."""
+    if not hass.services.has_service(DOMAIN, SERVICE_IMPORT_ROOMS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_ROOMS,
+            _async_import_rooms,
+            schema=IMPORT_ROOMS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT_ROOMS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_ROOMS,
+            _async_export_rooms,
+            supports_response=SupportsResponse.ONLY,
+        )
@@ -0,0 +1,55 @@
+"""Ventilation session tracking from window/door contact sensors."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+
+from .const import SESSION_LOG_SIZE
+from .data import VentilationSession
+
+# Room snapshot taken at session start and end: (water content, CO2, indoor temperature).
+Snapshot = tuple[float | None, float | None, float | None]
+
+
+class SessionTracker:
+    """Track the open contacts of one room and keep a bounded log of finished sessions."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.current: VentilationSession | None = None
+        self.log: deque[VentilationSession] = deque(maxlen=SESSION_LOG_SIZE)
+        self._open: set[str] = set()
+
+    @property
+    def last(self) -> VentilationSession | None:
+        """Return the most recently finished session."""
+        return self.log[-1] if self.log else None
+
+    def seed(self, entity_id: str, is_open: bool) -> None:
+        """Set a contact's state without starting or finishing a session, e.g. when it is first known."""
+        if is_open:
+            self._open.add(entity_id)
+        else:
+            self._open.discard(entity_id)
+
+    def contact_changed(self, entity_id: str, is_open: bool, when: datetime, snapshot: Snapshot) -> bool:
+        """Apply a contact change; return True when a session was finished."""
+        was_open = bool(self._open)
+        if is_open:
+            self._open.add(entity_id)
+        else:
+            self._open.discard(entity_id)
+
+        if not was_open and self._open:
+            self.current = VentilationSession(when, *snapshot)
+            return False
+
+        if was_open and not self._open and (session := self.current) is not None:
+            session.end = when
+            session.end_water, session.end_co2, session.end_temp = snapshot
+            self.log.append(session)
+            self.current = None
+            return True
+
+        return False
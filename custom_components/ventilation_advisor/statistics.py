@@ -0,0 +1,145 @@
+"""In-memory downsampling of high-frequency metrics into long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+from homeassistant.util.unit_conversion import MassVolumeConcentrationConverter
+
+from .const import CONF_ROOM_NAME, DOMAIN, LOGGER
+from .data import RoomResult
+
+CONCENTRATION = MassVolumeConcentrationConverter.UNIT_CLASS
+
+# Metrics that change on every source tick: (RoomResult field, name suffix, unit, unit class).
+HIGH_FREQUENCY_METRICS = (
+    ("indoor_ah", "Absolute Humidity", "g/m³", CONCENTRATION),
+    ("water_content", "Water Content", "ml", None),
+    ("drying_potential", "Drying Potential", "g/m³", CONCENTRATION),
+)
+
+PERIOD = timedelta(hours=1)
+
+
+def _period_start(now: datetime) -> datetime:
+    return now.replace(minute=0, second=0, microsecond=0)
+
+
+class _Bucket:
+    """Time-weighted mean, min and max of one metric within the current period.
+
+    A bucket is created with its first sample, so it always holds a last value to carry over.
+    """
+
+    __slots__ = ("covered", "integral", "last_time", "last_value", "maximum", "minimum", "start")
+
+    def __init__(self, start: datetime, value: float, now: datetime) -> None:
+        self.start = start
+        self.integral = 0.0
+        self.covered = 0.0
+        self.last_time = now
+        self.last_value = value
+        self.minimum = value
+        self.maximum = value
+
+    def add(self, value: float, now: datetime) -> None:
+        self._accumulate(now)
+        self.last_time = now
+        self.last_value = value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def _accumulate(self, now: datetime) -> None:
+        seconds = (now - self.last_time).total_seconds()
+        self.integral += self.last_value * seconds
+        self.covered += seconds
+
+    def close(self, end: datetime) -> StatisticData:
+        """Return the statistic of this period and restart at `end` with the last value carried over."""
+        self._accumulate(end)
+        mean = self.integral / self.covered if self.covered > 0 else self.last_value
+        stat = StatisticData(start=self.start, mean=mean, min=self.minimum, max=self.maximum)
+
+        self.start = end
+        self.integral = 0.0
+        self.covered = 0.0
+        self.last_time = end
+        self.minimum = self.maximum = self.last_value
+        return stat
+
+
+class VentilationStatistics:
+    """Aggregate derived metrics in memory and publish them hourly as external statistics."""
+
+    def __init__(self, hass: HomeAssistant, rooms: dict[str, dict]) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._buckets: dict[str, _Bucket] = {}
+        # Periods closed by a sample arriving after the hour boundary, awaiting the next publish.
+        self._pending: dict[str, list[StatisticData]] = {}
+        self._keys: dict[tuple[str | None, str], str] = {}
+
+        self._register(None, "outdoor_ah", "Outdoor Absolute Humidity", "g/m³", CONCENTRATION)
+        for room_id, room in rooms.items():
+            for field, suffix, unit, unit_class in HIGH_FREQUENCY_METRICS:
+                self._register(room_id, field, f"{room[CONF_ROOM_NAME]} {suffix}", unit, unit_class)
+
+    def _register(self, room_id: str | None, field: str, name: str, unit: str, unit_class: str | None) -> None:
+        object_id = field if room_id is None else f"room_{slugify(room_id)}_{field}"
+        statistic_id = f"{DOMAIN}:{object_id}"
+        self._keys[(room_id, field)] = statistic_id
+        self._metadata[statistic_id] = StatisticMetaData(
+            has_sum=False,
+            mean_type=StatisticMeanType.ARITHMETIC,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_class=unit_class,
+            unit_of_measurement=unit,
+        )
+
+    @callback
+    def async_add_outdoor(self, value: float | None, now: datetime) -> None:
+        """Record a new outdoor absolute humidity sample."""
+        if value is not None:
+            self._add(self._keys[(None, "outdoor_ah")], value, now)
+
+    @callback
+    def async_add_room(self, room_id: str, result: RoomResult, now: datetime) -> None:
+        """Record the high-frequency metrics of a freshly evaluated room."""
+        for field, _suffix, _unit, _unit_class in HIGH_FREQUENCY_METRICS:
+            if (value := getattr(result, field)) is not None:
+                self._add(self._keys[(room_id, field)], value, now)
+
+    def _add(self, statistic_id: str, value: float, now: datetime) -> None:
+        if (bucket := self._buckets.get(statistic_id)) is None:
+            self._buckets[statistic_id] = _Bucket(_period_start(now), value, now)
+            return
+        self._roll_over(statistic_id, bucket, now)
+        bucket.add(value, now)
+
+    def _roll_over(self, statistic_id: str, bucket: _Bucket, now: datetime) -> None:
+        """Close every period of `bucket` that ended at or before `now`."""
+        while now >= bucket.start + PERIOD:
+            self._pending.setdefault(statistic_id, []).append(bucket.close(bucket.start + PERIOD))
+
+    @callback
+    def async_publish(self, now: datetime) -> None:
+        """Close every period that ended before `now` and import it into the recorder."""
+        recorder_loaded = "recorder" in self.hass.config.components
+        boundary = _period_start(now)
+        published = 0
+        for statistic_id, bucket in self._buckets.items():
+            self._roll_over(statistic_id, bucket, boundary)
+            stats = self._pending.pop(statistic_id, [])
+            if stats and recorder_loaded:
+                async_add_external_statistics(self.hass, self._metadata[statistic_id], stats)
+                published += len(stats)
+
+        if published:
+            LOGGER.debug("Published %s downsampled statistics", published)
@@ -0,0 +1,85 @@
+"""Rate of change of a room quantity over a sliding time window."""
+
+from __future__ import annotations
+
+from array import array
+
+from .const import TREND_CAPACITY, TREND_MIN_SAMPLES, TREND_MIN_SPACING, TREND_MIN_SPAN, TREND_REBASE, TREND_WINDOW
+
+
+class TrendBuffer:
+    """Least-squares slope over a sliding window, kept in a fixed-size array-backed ring buffer.
+
+    Running sums are updated when a sample enters or leaves the window, so adding a sample and
+    reading the slope are O(1). Times are stored in hours relative to an origin that is moved
+    forward once a day, which keeps the sums small enough to avoid cancellation errors.
+    """
+
+    __slots__ = ("_count", "_hours", "_origin", "_st", "_start", "_stt", "_stv", "_sv", "_values")
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._hours = array("d", bytes(8 * TREND_CAPACITY))
+        self._values = array("d", bytes(8 * TREND_CAPACITY))
+        self._start = 0
+        self._count = 0
+        self._origin = 0.0
+        self._st = self._sv = self._stt = self._stv = 0.0
+
+    def _index(self, offset: int) -> int:
+        return (self._start + offset) % TREND_CAPACITY
+
+    def _account(self, index: int, sign: float) -> None:
+        t = self._hours[index]
+        v = self._values[index]
+        self._st += sign * t
+        self._sv += sign * v
+        self._stt += sign * t * t
+        self._stv += sign * t * v
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample; samples closer than the minimum spacing replace the newest one."""
+        if not self._count:
+            self._origin = timestamp
+        hours = (timestamp - self._origin) / 3600
+
+        if self._count >= 2 and hours - self._hours[self._index(self._count - 2)] < TREND_MIN_SPACING / 3600:
+            self._account(self._index(self._count - 1), -1.0)
+            self._count -= 1
+
+        while self._count and (self._count == TREND_CAPACITY or self._hours[self._start] < hours - TREND_WINDOW / 3600):
+            self._account(self._start, -1.0)
+            self._start = self._index(1)
+            self._count -= 1
+
+        index = self._index(self._count)
+        self._hours[index] = hours
+        self._values[index] = value
+        self._count += 1
+        self._account(index, 1.0)
+
+        if hours > TREND_REBASE / 3600:
+            self._rebase()
+
+    def _rebase(self) -> None:
+        """Move the origin to the oldest sample and recompute the sums from scratch."""
+        shift = self._hours[self._start]
+        self._origin += shift * 3600
+        self._st = self._sv = self._stt = self._stv = 0.0
+        for offset in range(self._count):
+            index = self._index(offset)
+            self._hours[index] -= shift
+            self._account(index, 1.0)
+
+    @property
+    def slope(self) -> float | None:
+        """Return the change per hour, or None until the window holds enough samples."""
+        n = self._count
+        if n < TREND_MIN_SAMPLES:
+            return None
+        if self._hours[self._index(n - 1)] - self._hours[self._start] < TREND_MIN_SPAN / 3600:
+            return None
+        denominator = n * self._stt - self._st * self._st
+        if denominator <= 0:
+            return None
+        return (n * self._stv - self._st * self._sv) / denominator
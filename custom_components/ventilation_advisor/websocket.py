@@ -0,0 +1,86 @@
+"""WebSocket API for Ventilation Advisor dashboards."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_ROOM_NAME, DOMAIN
+from .coordinator import VentilationCoordinator
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+def _room_payload(coordinator: VentilationCoordinator, room_ids: set[str] | list[str]) -> dict[str, Any]:
+    payload = {}
+    for room_id in room_ids:
+        if (result := coordinator.results.get(room_id)) is None:
+            continue
+        payload[room_id] = {"name": coordinator.rooms[room_id][CONF_ROOM_NAME], **result.as_dict()}
+    return payload
+
+
+def _loaded_entry(hass: HomeAssistant, entry_id: str | None) -> ConfigEntry | None:
+    """Return the requested entry, or the integration's single entry, if it is loaded."""
+    if entry_id is None:
+        entry = next(iter(hass.config_entries.async_entries(DOMAIN)), None)
+    else:
+        entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        return None
+    return entry
+
+
+@websocket_api.decorators.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant, connection: websocket_api.connection.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send a snapshot of every room, then one delta message per evaluation pass."""
+    if (entry := _loaded_entry(hass, msg.get("entry_id"))) is None:
+        connection.send_error(msg["id"], websocket_api.const.ERR_NOT_FOUND, "No loaded Ventilation Advisor entry")
+        return
+
+    coordinator: VentilationCoordinator = entry.runtime_data.coordinator
+    msg_id = msg["id"]
+
+    @callback
+    def forward(changed: set[str] | None, outdoor: bool) -> None:
+        if changed is None:
+            # The entry is unloading or reloading; the client has to subscribe again.
+            connection.subscriptions.pop(msg_id, None)
+            connection.send_message(websocket_api.messages.event_message(msg_id, {"closed": True}))
+            return
+        if not changed and not outdoor:
+            return
+        delta: dict[str, Any] = {"rooms": _room_payload(coordinator, changed)}
+        if outdoor:
+            delta["outdoor_ah"] = coordinator.outdoor_ah
+        connection.send_message(websocket_api.messages.event_message(msg_id, delta))
+
+    connection.subscriptions[msg_id] = coordinator.async_add_cycle_listener(forward)
+    connection.send_result(msg_id)
+    connection.send_message(
+        websocket_api.messages.event_message(
+            msg_id,
+            {
+                "snapshot": True,
+                "outdoor_ah": coordinator.outdoor_ah,
+                "rooms": _room_payload(coordinator, list(coordinator.rooms)),
+            },
+        )
+    )
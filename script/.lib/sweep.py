@@ -0,0 +1,229 @@
+"""Parallel threshold and strategy sweep over recorded sensor history.
+
+Replays a Home Assistant history export (CSV with entity_id, state, last_changed) through
+the integration's compiled decision rules for every combination of strategy and thresholds.
+The forward-filled source columns are placed once in shared memory, and every worker of the
+process pool attaches to that block instead of receiving its own copy.
+
+For each setting it reports the hours during which indoor humidity was at or above a reference
+level while the advice did not recommend ventilating, and the number of ventilation
+recommendations (transitions into an urgent or recommended advice). Settings that no other
+setting beats on both counts are marked as Pareto-optimal.
+"""
+
+from __future__ import annotations
+
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from datetime import datetime
+import itertools
+import math
+from multiprocessing import shared_memory
+import os
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from custom_components.ventilation_advisor.calculations import compile_room_rules, evaluate_room
+from custom_components.ventilation_advisor.const import (
+    CO2_CRITICAL,
+    CO2_WARN,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_CRITICAL_OVERRIDE,
+    CONF_CO2_WARN_OVERRIDE,
+    CONF_FLOOR_AREA,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    MOULD_RISK_CRITICAL,
+    MOULD_RISK_SAFE,
+    STRATEGY_OPTIONS,
+)
+
+# Gaps in the history longer than this are not counted as at-risk time.
+MAX_GAP = 3600.0
+
+# Column layout of the shared block: time, outdoor temp, outdoor humidity, then 3 per room.
+OUTDOOR_COLUMNS = 3
+ROOM_COLUMNS = 3
+
+_shm: shared_memory.SharedMemory | None = None
+_columns: list[memoryview] = []
+_risk_humidity = 0.0
+
+
+def _parse_list(value: str, cast=float) -> list:
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _load_columns(path: Path, outdoor: list[str], rooms: list[list[str]]) -> list[list[float]]:
+    """Read the history export into forward-filled columns on a common timeline."""
+    slots: dict[str, list[int]] = {}
+    for index, entity_id in enumerate(outdoor, start=1):
+        slots.setdefault(entity_id, []).append(index)
+    for room_index, entity_ids in enumerate(rooms):
+        for offset, entity_id in enumerate(entity_ids):
+            slots.setdefault(entity_id, []).append(OUTDOOR_COLUMNS + room_index * ROOM_COLUMNS + offset)
+
+    events = []
+    with path.open(newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            if (targets := slots.get(row["entity_id"])) is None:
+                continue
+            try:
+                value = float(row["state"])
+            except ValueError:
+                value = float("nan")
+            timestamp = datetime.fromisoformat(row["last_changed"]).timestamp()
+            events.append((timestamp, targets, value))
+    events.sort(key=lambda event: event[0])
+
+    width = OUTDOOR_COLUMNS + len(rooms) * ROOM_COLUMNS
+    current = [float("nan")] * width
+    columns: list[list[float]] = [[] for _ in range(width)]
+    for timestamp, group in itertools.groupby(events, key=lambda event: event[0]):
+        for _timestamp, targets, value in group:
+            for target in targets:
+                current[target] = value
+        current[0] = timestamp
+        for column, value in zip(columns, current, strict=True):
+            column.append(value)
+    return columns
+
+
+def _attach(name: str, width: int, length: int, risk_humidity: float) -> None:
+    """Worker initializer: map the shared block without copying it."""
+    global _shm, _risk_humidity  # noqa: PLW0603
+    _shm = shared_memory.SharedMemory(name=name, track=False)
+    values = _shm.buf.cast("d")
+    _columns[:] = [values[i * length : (i + 1) * length] for i in range(width)]
+    _risk_humidity = risk_humidity
+
+
+def _value(column: memoryview, index: int) -> float | None:
+    value = column[index]
+    return None if math.isnan(value) else value  # NaN marks an unknown state
+
+
+def _evaluate(setting: tuple[str, float, float, float, float]) -> tuple[float, int, float]:
+    """Replay the history for one setting; return (unadvised risk hours, recommendations, advised hours)."""
+    strategy, safe, critical, co2_warn, co2_critical = setting
+    room = {
+        CONF_FLOOR_AREA: 1.0,
+        CONF_CEILING_HEIGHT: 1.0,
+        CONF_MOULD_SAFE_OVERRIDE: safe,
+        CONF_MOULD_CRITICAL_OVERRIDE: critical,
+        CONF_CO2_WARN_OVERRIDE: co2_warn,
+        CONF_CO2_CRITICAL_OVERRIDE: co2_critical,
+    }
+    rules = compile_room_rules(room, strategy)
+    times, o_t, o_h = _columns[:OUTDOOR_COLUMNS]
+    length = len(times)
+
+    risk_seconds = advised_seconds = 0.0
+    recommendations = 0
+    for start in range(OUTDOOR_COLUMNS, len(_columns), ROOM_COLUMNS):
+        i_t, i_h, co2 = _columns[start : start + ROOM_COLUMNS]
+        ventilating = False
+        for k in range(length - 1):
+            humidity = _value(i_h, k)
+            result = evaluate_room(rules, _value(i_t, k), humidity, _value(o_t, k), _value(o_h, k), co2=_value(co2, k))
+            advised = result.advice.recommends_ventilation
+            if advised and not ventilating:
+                recommendations += 1
+            ventilating = advised
+            duration = min(times[k + 1] - times[k], MAX_GAP)
+            if advised:
+                advised_seconds += duration
+            elif humidity is not None and humidity >= _risk_humidity:
+                risk_seconds += duration
+
+    return round(risk_seconds / 3600, 2), recommendations, round(advised_seconds / 3600, 2)
+
+
+def _pareto(scores: list[tuple[float, int, float]]) -> list[bool]:
+    """Mark settings not dominated on unadvised risk hours and recommendations."""
+    objectives = [score[:2] for score in scores]
+    return [
+        not any(other[0] <= own[0] and other[1] <= own[1] and other != own for other in objectives)
+        for own in objectives
+    ]
+
+
+def main() -> None:
+    """Run the sweep."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=Path, required=True, help="History CSV (entity_id,state,last_changed)")
+    parser.add_argument("--outdoor", required=True, help="Outdoor temperature and humidity entity ids: TEMP,HUM")
+    parser.add_argument(
+        "--room", action="append", required=True, help="Room source entity ids: TEMP,HUM[,CO2] (repeatable)"
+    )
+    parser.add_argument("--strategies", default=",".join(STRATEGY_OPTIONS))
+    parser.add_argument("--mould-safe", default=str(MOULD_RISK_SAFE))
+    parser.add_argument("--mould-critical", default=str(MOULD_RISK_CRITICAL))
+    parser.add_argument("--co2-warn", default=str(CO2_WARN))
+    parser.add_argument("--co2-critical", default=str(CO2_CRITICAL))
+    parser.add_argument("--risk-humidity", type=float, default=70.0, help="Reference RH counted as at-risk time")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    outdoor = _parse_list(args.outdoor, str)
+    rooms = [[*_parse_list(room, str), ""][:ROOM_COLUMNS] for room in args.room]
+    if len(outdoor) != 2 or any(not room[0] or not room[1] for room in rooms):
+        parser.error("--outdoor needs TEMP,HUM and every --room needs at least TEMP,HUM")
+
+    settings = [
+        setting
+        for setting in itertools.product(
+            _parse_list(args.strategies, str),
+            _parse_list(args.mould_safe),
+            _parse_list(args.mould_critical),
+            _parse_list(args.co2_warn),
+            _parse_list(args.co2_critical),
+        )
+        if setting[1] < setting[2] and setting[3] < setting[4]
+    ]
+
+    columns = _load_columns(args.history, outdoor, rooms)
+    width, length = len(columns), len(columns[0])
+    if length < 2:
+        parser.error("History contains fewer than two samples for the selected entities")
+
+    shm = shared_memory.SharedMemory(create=True, size=width * length * 8)
+    try:
+        for index, column in enumerate(columns):
+            shm.buf[index * length * 8 : (index + 1) * length * 8] = array("d", column).tobytes()
+
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_attach,
+            initargs=(shm.name, width, length, args.risk_humidity),
+        ) as pool:
+            chunksize = max(1, len(settings) // (4 * (args.workers or 1)))
+            scores = list(pool.map(_evaluate, settings, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(
+        [
+            "strategy",
+            "mould_safe",
+            "mould_critical",
+            "co2_warn",
+            "co2_critical",
+            "unadvised_risk_hours",
+            "recommendations",
+            "advised_hours",
+            "pareto_optimal",
+        ]
+    )
+    for setting, score, optimal in zip(settings, scores, _pareto(scores), strict=True):
+        writer.writerow([*setting, *score, optimal])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for the Ventilation Advisor integration."""
@@ -0,0 +1,40 @@
+"""Fixtures for the Ventilation Advisor tests."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.const import CONF_OUTDOOR_HUMIDITY, CONF_OUTDOOR_TEMP, CONF_ROOMS, DOMAIN
+from homeassistant.core import HomeAssistant
+
+OUTDOOR_TEMP = "sensor.outdoor_temperature"
+OUTDOOR_HUMIDITY = "sensor.outdoor_humidity"
+
+
+@pytest.fixture
+async def setup_entry(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> Callable[..., Awaitable[MockConfigEntry]]:
+    """Return a function that adds and sets up an entry with the given rooms and options.
+
+    The outdoor sources are `sensor.outdoor_temperature` and `sensor.outdoor_humidity`.
+    """
+
+    async def _setup(*rooms: dict[str, Any], **options: Any) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=3,
+            title="Ventilation System",
+            data={CONF_OUTDOOR_TEMP: OUTDOOR_TEMP, CONF_OUTDOOR_HUMIDITY: OUTDOOR_HUMIDITY},
+            options={CONF_ROOMS: list(rooms), **options},
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        return entry
+
+    return _setup
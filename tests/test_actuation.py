@@ -0,0 +1,102 @@
+"""Tests for the control of fans, dehumidifiers and switches."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.ventilation_advisor.actuation import ActuationController, is_dehumidifier, needs_drying
+from custom_components.ventilation_advisor.const import (
+    CONF_ACTUATORS,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    DEHUMIDIFY_START_RISK,
+    DEHUMIDIFY_STOP_RISK,
+)
+from custom_components.ventilation_advisor.data import Advice, RoomResult
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+FAN = "fan.bath"
+DEHUMIDIFIER = "humidifier.bath_dryer"
+
+
+def _result(**values: Any) -> RoomResult:
+    return RoomResult(volume=20.0, **values)
+
+
+@pytest.mark.unit
+def test_drying_starts_and_stops_with_hysteresis() -> None:
+    """A dehumidifier starts at the start risk and runs on until the risk falls to the stop risk."""
+    between = (DEHUMIDIFY_START_RISK + DEHUMIDIFY_STOP_RISK) / 2
+
+    assert needs_drying(_result(mould_risk=between, drying_potential=1.0), running=False) is False
+    assert needs_drying(_result(mould_risk=DEHUMIDIFY_START_RISK, drying_potential=1.0), running=False) is True
+    assert needs_drying(_result(mould_risk=between, drying_potential=1.0), running=True) is True
+    assert needs_drying(_result(mould_risk=DEHUMIDIFY_STOP_RISK, drying_potential=1.0), running=True) is False
+
+
+@pytest.mark.unit
+def test_drying_without_outdoor_potential_or_during_moisture_event() -> None:
+    """Below the start risk, drying starts when outdoor air cannot dry the room or moisture is rising."""
+    between = (DEHUMIDIFY_START_RISK + DEHUMIDIFY_STOP_RISK) / 2
+
+    assert needs_drying(_result(mould_risk=between, drying_potential=0.0), running=False) is True
+    assert needs_drying(_result(mould_risk=DEHUMIDIFY_STOP_RISK, drying_potential=0.0), running=False) is False
+    assert needs_drying(_result(mould_risk=0.0, moisture_event=True), running=False) is True
+    assert needs_drying(_result(), running=True) is None
+
+
+@pytest.mark.unit
+async def test_only_dehumidifier_device_class_counts(hass: HomeAssistant) -> None:
+    """Humidifiers that add moisture are not treated as dehumidifiers."""
+    hass.states.async_set(DEHUMIDIFIER, STATE_OFF, {"device_class": "dehumidifier"})
+    hass.states.async_set("humidifier.bedroom", STATE_OFF, {"device_class": "humidifier"})
+
+    assert is_dehumidifier(hass, DEHUMIDIFIER)
+    assert not is_dehumidifier(hass, "humidifier.bedroom")
+    assert not is_dehumidifier(hass, "humidifier.missing")
+
+
+@pytest.mark.unit
+async def test_failed_commands_are_retried_until_confirmed(hass: HomeAssistant) -> None:
+    """An actuator stays pending after a failed call and is commanded again on the next flush."""
+    calls: list[list[str]] = []
+
+    async def _turn_on(call: ServiceCall) -> None:
+        calls.append(call.data["entity_id"])
+        if len(calls) == 1:
+            raise HomeAssistantError("device did not respond")
+        for entity_id in call.data["entity_id"]:
+            hass.states.async_set(entity_id, STATE_ON)
+
+    hass.services.async_register("homeassistant", "turn_on", _turn_on)
+    hass.states.async_set(FAN, STATE_OFF)
+    hass.states.async_set("humidifier.bedroom", STATE_OFF, {"device_class": "humidifier"})
+    coordinator = SimpleNamespace(
+        rooms={
+            "bath": {
+                CONF_ACTUATORS: [FAN, "humidifier.bedroom"],
+                CONF_MIN_ON_TIME: 0,
+                CONF_MIN_OFF_TIME: 0,
+            }
+        },
+        results={"bath": _result(mould_risk=80.0, advice=Advice.URGENT_MOULD)},
+    )
+    controller = ActuationController(hass, coordinator)  # type: ignore[arg-type]
+    controller._async_cycle({"bath"}, False)  # noqa: SLF001
+    now = dt_util.utcnow() + timedelta(seconds=1)
+
+    await controller._async_flush(now)  # noqa: SLF001
+    assert controller.pending == {FAN}
+
+    await controller._async_flush(now)  # noqa: SLF001
+    await controller._async_flush(now)  # noqa: SLF001
+    assert calls == [[FAN], [FAN]]
+    assert controller.pending == set()
+    assert hass.states.is_state("humidifier.bedroom", STATE_OFF)
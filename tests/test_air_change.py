@@ -0,0 +1,77 @@
+"""Tests for the air change rate estimation from CO2 decay."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import math
+
+import pytest
+
+from custom_components.ventilation_advisor.air_change import AirChangeEstimator
+from custom_components.ventilation_advisor.const import AIR_CHANGE_SMOOTHING, CO2_OUTDOOR_BASELINE
+
+START = datetime(2026, 1, 15, 8, 0, tzinfo=UTC)
+
+
+def _decay(ach: float, peak: float, minutes: int) -> list[float]:
+    """CO2 levels sampled once per minute while the room air is exchanged at `ach` per hour."""
+    excess = peak - CO2_OUTDOOR_BASELINE
+    return [CO2_OUTDOOR_BASELINE + excess * math.exp(-ach * minute / 60) for minute in range(minutes)]
+
+
+def _feed(estimator: AirChangeEstimator, levels: list[float]) -> list[bool]:
+    return [estimator.add_sample(ppm, START + timedelta(minutes=minute)) for minute, ppm in enumerate(levels)]
+
+
+@pytest.mark.unit
+def test_learns_rate_from_synthetic_decay() -> None:
+    """An exponential decay followed by a sustained rise yields its air change rate."""
+    estimator = AirChangeEstimator()
+    levels = _decay(2.0, 1600, 40)
+    rise = levels[-1] + 300
+    updates = _feed(estimator, [*levels, rise, rise, rise])
+
+    assert updates == [False] * 42 + [True]
+    assert estimator.episodes == 1
+    assert estimator.learned_ach == pytest.approx(2.0, abs=0.01)
+
+
+@pytest.mark.unit
+def test_sensor_noise_does_not_end_the_episode() -> None:
+    """Short excursions above the minimum are kept in the fit instead of ending the decay."""
+    estimator = AirChangeEstimator()
+    levels = _decay(1.5, 1800, 60)
+    for minute in (15, 16, 35):
+        levels[minute] += 90
+    for index in range(len(levels)):
+        levels[index] += 25 if index % 2 else -25
+    rise = levels[-1] + 300
+    _feed(estimator, [*levels, rise, rise, rise])
+
+    assert estimator.episodes == 1
+    assert estimator.learned_ach == pytest.approx(1.5, abs=0.1)
+
+
+@pytest.mark.unit
+def test_short_or_shallow_decay_is_discarded() -> None:
+    """A drop smaller than the minimum does not update the learned rate."""
+    estimator = AirChangeEstimator()
+    levels = _decay(2.0, 600, 40)
+    rise = levels[-1] + 300
+    _feed(estimator, [*levels, rise, rise, rise])
+
+    assert estimator.episodes == 0
+    assert estimator.learned_ach is None
+
+
+@pytest.mark.unit
+def test_learned_rate_is_smoothed_across_episodes() -> None:
+    """A second episode moves the learned rate part of the way towards its own rate."""
+    estimator = AirChangeEstimator()
+    first = _decay(2.0, 1600, 40)
+    second = _decay(4.0, 1700, 30)
+    _feed(estimator, [*first, *second, 2000])
+
+    assert estimator.episodes == 2
+    assert estimator.last_episode_ach == pytest.approx(4.0, abs=0.01)
+    assert estimator.learned_ach == pytest.approx(2.0 + AIR_CHANGE_SMOOTHING * (4.0 - 2.0), abs=0.02)
@@ -0,0 +1,258 @@
+"""Tests for the room calculations and the compiled advice rules."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from custom_components.ventilation_advisor.calculations import (
+    calculate_absolute_humidity,
+    calculate_dew_point,
+    calculate_room_volume,
+    calculate_surface_humidity,
+    calculate_surface_mould_risk,
+    compile_room_rules,
+    evaluate_room,
+)
+from custom_components.ventilation_advisor.const import (
+    CO2_CRITICAL,
+    CO2_WARN,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_CRITICAL_OVERRIDE,
+    CONF_CO2_WARN_OVERRIDE,
+    CONF_FLOOR_AREA,
+    CONF_HAS_SLOPE,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    CONF_ROOM_NAME,
+    CONF_SLOPE_A,
+    CONF_SLOPE_B,
+    CONF_SLOPE_C,
+    MOULD_RISK_CRITICAL,
+    MOULD_RISK_SAFE,
+    STRATEGY_AGGRESSIVE,
+    STRATEGY_BALANCED,
+    STRATEGY_ENERGY_SAVER,
+    STRATEGY_FRESH_AIR,
+    STRATEGY_OPTIONS,
+    SURFACE_MOULD_CRITICAL,
+    SURFACE_MOULD_SAFE,
+)
+
+# Reference copy of the per-sensor logic used before the rules were compiled per room.
+
+
+def _reference_mould_risk(humidity: float, safe: float, critical: float) -> float:
+    if humidity < safe:
+        return 0.0
+    if humidity >= critical:
+        return 100.0
+    return round((humidity - safe) * (100 / (critical - safe)), 0)
+
+
+def _reference_efficiency(i_t: float, i_h: float, o_t: float, o_h: float) -> str:
+    dp = calculate_absolute_humidity(i_t, i_h) - calculate_absolute_humidity(o_t, o_h)
+    if dp <= 0:
+        return "Counter-Productive"
+
+    dt = i_t - o_t
+    if dt <= 0:
+        return "High (Free Cooling)"
+
+    penalty_factor = 1.0
+    if i_h > 40:
+        penalty_factor = 1 + ((i_h - 40) * 0.005)
+
+    ratio = dp / (dt * penalty_factor)
+    if ratio > 0.3:
+        return "High"
+    if ratio > 0.1:
+        return "Medium"
+    return "Low (Wasteful)"
+
+
+def _reference_advice(
+    risk_val: float,
+    power_val: float,
+    eff_val: str,
+    co2_val: float | None,
+    *,
+    strategy: str,
+    c_warn: float,
+    c_crit: float,
+) -> str:
+    if risk_val >= 80:
+        return "Urgent (Mould Risk)"
+
+    if co2_val is not None and co2_val >= c_crit:
+        return "Urgent (Air Quality)"
+
+    if power_val <= 0:
+        if co2_val and co2_val >= c_warn:
+            return "Recommended (Fresh Air)"
+        return "Hold (Ineffective)"
+
+    if strategy == STRATEGY_ENERGY_SAVER:
+        if eff_val.startswith("High"):
+            return "Optional (Efficient)"
+        return "Hold (Eco Mode)"
+
+    if strategy == STRATEGY_AGGRESSIVE:
+        return "Recommended (Drying)"
+
+    is_fresh_air_lover = strategy == STRATEGY_FRESH_AIR
+    if risk_val > (30 if is_fresh_air_lover else 50):
+        return "Recommended"
+    if power_val > (1.0 if is_fresh_air_lover else 2.0):
+        return "Recommended (Quick)"
+    if eff_val.startswith("High"):
+        return "Optional (Efficient)"
+
+    return "Hold (Low Necessity)"
+
+
+def _reference_evaluate(room: dict, strategy: str, sources: tuple) -> dict:
+    i_t, i_h, o_t, o_h, co2 = sources
+    result = {
+        "volume": round(calculate_room_volume(room), 2),
+        "indoor_ah": None,
+        "water_content": None,
+        "mould_risk": None,
+        "drying_potential": None,
+        "efficiency": "Unknown",
+        "advice": "Unknown",
+    }
+
+    if i_h is not None:
+        result["mould_risk"] = _reference_mould_risk(
+            i_h,
+            room.get(CONF_MOULD_SAFE_OVERRIDE, MOULD_RISK_SAFE),
+            room.get(CONF_MOULD_CRITICAL_OVERRIDE, MOULD_RISK_CRITICAL),
+        )
+
+    if i_t is None or i_h is None:
+        return result
+
+    i_ah = calculate_absolute_humidity(i_t, i_h)
+    result["indoor_ah"] = i_ah
+    result["water_content"] = round(i_ah * calculate_room_volume(room), 1)
+
+    if o_t is None or o_h is None:
+        return result
+
+    result["drying_potential"] = round(i_ah - calculate_absolute_humidity(o_t, o_h), 2)
+    result["efficiency"] = _reference_efficiency(i_t, i_h, o_t, o_h)
+
+    if result["mould_risk"] is not None:
+        result["advice"] = _reference_advice(
+            result["mould_risk"],
+            result["drying_potential"],
+            result["efficiency"],
+            co2,
+            strategy=strategy,
+            c_warn=room.get(CONF_CO2_WARN_OVERRIDE, CO2_WARN),
+            c_crit=room.get(CONF_CO2_CRITICAL_OVERRIDE, CO2_CRITICAL),
+        )
+
+    return result
+
+
+ROOMS = {
+    "defaults": {CONF_ROOM_NAME: "Living Room", CONF_FLOOR_AREA: 20.0, CONF_CEILING_HEIGHT: 2.5},
+    "overrides": {
+        CONF_ROOM_NAME: "Attic",
+        CONF_FLOOR_AREA: 15.0,
+        CONF_CEILING_HEIGHT: 2.4,
+        CONF_HAS_SLOPE: True,
+        CONF_SLOPE_A: 2.0,
+        CONF_SLOPE_B: 1.5,
+        CONF_SLOPE_C: 4.0,
+        CONF_MOULD_SAFE_OVERRIDE: 55.0,
+        CONF_MOULD_CRITICAL_OVERRIDE: 68.0,
+        CONF_CO2_WARN_OVERRIDE: 800.0,
+        CONF_CO2_CRITICAL_OVERRIDE: 1200.0,
+    },
+}
+
+INDOOR_TEMPS = (None, -2.0, 12.0, 18.5, 21.0, 24.0, 30.0)
+INDOOR_HUMIDITIES = (None, 0.0, 35.0, 45.0, 55.0, 60.0, 62.5, 68.0, 70.0, 75.0, 85.0, 100.0)
+OUTDOOR_TEMPS = (None, -15.0, 0.0, 8.0, 18.5, 21.0, 35.0)
+OUTDOOR_HUMIDITIES = (None, 20.0, 50.0, 80.0, 100.0)
+CO2_LEVELS = (None, 0.0, 450.0, 800.0, 1000.0, 1200.0, 1400.0, 2500.0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("strategy", STRATEGY_OPTIONS)
+@pytest.mark.parametrize("room_key", list(ROOMS))
+def test_compiled_rules_match_reference(room_key: str, strategy: str) -> None:
+    """Compiled rules give the same metrics and labels as the previous logic over a dense input grid."""
+    room = ROOMS[room_key]
+    rules = compile_room_rules(room, strategy)
+
+    for sources in itertools.product(INDOOR_TEMPS, INDOOR_HUMIDITIES, OUTDOOR_TEMPS, OUTDOOR_HUMIDITIES, CO2_LEVELS):
+        expected = _reference_evaluate(room, strategy, sources)
+        i_t, i_h, o_t, o_h, co2 = sources
+        result = evaluate_room(rules, i_t, i_h, o_t, o_h, co2=co2)
+        actual = {
+            "volume": result.volume,
+            "indoor_ah": result.indoor_ah,
+            "water_content": result.water_content,
+            "mould_risk": result.mould_risk,
+            "drying_potential": result.drying_potential,
+            "efficiency": result.efficiency.label,
+            "advice": result.advice.label,
+        }
+        assert actual == expected, sources
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("temperature", "humidity", "dew_point"),
+    [(20.0, 50.0, 9.3), (25.0, 80.0, 21.3), (0.0, 100.0, 0.0), (-10.0, 60.0, -16.3)],
+)
+def test_dew_point_inverts_magnus(temperature: float, humidity: float, dew_point: float) -> None:
+    """The closed-form dew point matches reference values and saturates the air exactly."""
+    result = calculate_dew_point(temperature, humidity)
+
+    assert result == pytest.approx(dew_point, abs=0.05)
+    assert calculate_surface_humidity(temperature, humidity, result) == pytest.approx(100.0)
+
+
+@pytest.mark.unit
+def test_dew_point_of_dry_air_is_undefined() -> None:
+    """Without water vapour there is no dew point."""
+    assert calculate_dew_point(20.0, 0.0) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("surface_humidity", "risk"),
+    [
+        (50.0, 0.0),
+        (SURFACE_MOULD_SAFE, 0.0),
+        (72.5, 25.0),
+        (75.0, 50.0),
+        (SURFACE_MOULD_CRITICAL, 100.0),
+        (95.0, 100.0),
+    ],
+)
+def test_surface_humidity_maps_to_mould_risk(surface_humidity: float, risk: float) -> None:
+    """Surface humidity between 70% and 80% maps linearly onto 0-100% mould risk."""
+    assert calculate_surface_mould_risk(surface_humidity) == risk
+
+
+@pytest.mark.unit
+def test_cold_surface_raises_room_mould_risk() -> None:
+    """The coldest surface's humidity raises the mould risk above the room-air risk."""
+    rules = compile_room_rules(ROOMS["defaults"], STRATEGY_BALANCED)
+    # A surface at the dew point of air with 50% / 75% relative humidity sits at 75% surface humidity.
+    surface = calculate_dew_point(20.0, 50.0 * 100 / 75)
+    assert surface is not None
+
+    result = evaluate_room(rules, 20.0, 50.0, None, None, surfaces=(None, surface, surface + 3))
+
+    assert result.mould_risk == 50.0
+    assert result.condensation_margin == round(surface - calculate_dew_point(20.0, 50.0), 1)
+    assert result.surface_margins[0] is None
+    assert evaluate_room(rules, 20.0, 50.0, None, None).mould_risk == 0.0
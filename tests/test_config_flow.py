@@ -0,0 +1,178 @@
+"""Tests for the room steps and room discovery of the options flow."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.const import (
+    CONF_ACTUATORS,
+    CONF_AREA_ID,
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_CRITICAL_OVERRIDE,
+    CONF_CO2_SENSOR,
+    CONF_CO2_WARN_OVERRIDE,
+    CONF_CONTACT_SENSORS,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    CONF_SURFACE_SENSORS,
+)
+from custom_components.ventilation_advisor.room_config import validate_rooms
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+BATH_SENSORS = {CONF_INDOOR_TEMP: ["sensor.bath_temperature"], CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"]}
+
+
+async def _add_room_until_advanced(hass: HomeAssistant, entry: MockConfigEntry, **sensors: Any) -> dict[str, Any]:
+    """Start an options flow and fill in a room up to the advanced step."""
+    area = ar.async_get(hass).async_get_or_create("Bath")
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {"next_step_id": "add_room"})
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_ROOM_NAME: "Bath", CONF_AREA_ID: area.id, CONF_FLOOR_AREA: 8.0, CONF_CEILING_HEIGHT: 2.5},
+    )
+    return await hass.config_entries.options.async_configure(result["flow_id"], {**BATH_SENSORS, **sensors})
+
+
+@pytest.mark.integration
+async def test_advanced_step_rejects_unordered_thresholds(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """Limits a room import would reject are reported on the form, and the saved room imports again."""
+    entry = await setup_entry()
+    result = await _add_room_until_advanced(hass, entry)
+    assert result["step_id"] == "room_advanced"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_MOULD_SAFE_OVERRIDE: 80,
+            CONF_MOULD_CRITICAL_OVERRIDE: 70,
+            CONF_CO2_WARN_OVERRIDE: 1500,
+            CONF_CO2_CRITICAL_OVERRIDE: 1500,
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {
+        CONF_MOULD_CRITICAL_OVERRIDE: "threshold_order",
+        CONF_CO2_CRITICAL_OVERRIDE: "threshold_order",
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MOULD_CRITICAL_OVERRIDE: 90, CONF_CO2_CRITICAL_OVERRIDE: 2000}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    (room,) = result["data"][CONF_ROOMS]
+    assert validate_rooms([{key: value for key, value in room.items() if key != "id"}])
+
+
+@pytest.mark.integration
+async def test_advanced_step_limits_mould_thresholds_to_percent(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """Mould limits outside 0-100% are rejected by the form."""
+    entry = await setup_entry()
+    result = await _add_room_until_advanced(hass, entry)
+
+    with pytest.raises(InvalidData, match="mould_critical_override"):
+        await hass.config_entries.options.async_configure(result["flow_id"], {CONF_MOULD_CRITICAL_OVERRIDE: 120})
+
+
+@pytest.mark.integration
+async def test_switching_times_only_for_rooms_with_actuators(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """Minimum on/off times are asked for rooms with actuators and cannot be negative."""
+    entry = await setup_entry()
+    result = await _add_room_until_advanced(hass, entry)
+    assert CONF_MIN_ON_TIME not in result["data_schema"].schema
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {})
+    assert CONF_MIN_ON_TIME not in result["data"][CONF_ROOMS][0]
+
+    result = await _add_room_until_advanced(hass, entry, **{CONF_ACTUATORS: ["fan.bath"]})
+    assert {CONF_MIN_ON_TIME, CONF_MIN_OFF_TIME} <= set(result["data_schema"].schema)
+    with pytest.raises(InvalidData, match="min_off_time"):
+        await hass.config_entries.options.async_configure(result["flow_id"], {CONF_MIN_OFF_TIME: -5})
+
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {CONF_MIN_OFF_TIME: 5})
+    room = result["data"][CONF_ROOMS][-1]
+    assert room[CONF_MIN_OFF_TIME] == 5
+    assert validate_rooms([{key: value for key, value in room.items() if key != "id"}])
+
+
+def _registered(hass: HomeAssistant, entity_id: str, device_class: str, area_id: str) -> None:
+    domain, object_id = entity_id.split(".")
+    registry = er.async_get(hass)
+    entry = registry.async_get_or_create(
+        domain, "test", entity_id, suggested_object_id=object_id, original_device_class=device_class
+    )
+    registry.async_update_entity(entry.entity_id, area_id=area_id)
+
+
+@pytest.mark.integration
+async def test_discovery_proposes_unconfigured_areas(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """Areas with room sensors are proposed without outdoor, surface or already used sensors."""
+    areas = ar.async_get(hass)
+    bath, kitchen, office, balcony = (areas.async_create(name) for name in ("Bath", "Kitchen", "Office", "Balcony"))
+    _registered(hass, "sensor.bath_temperature", "temperature", bath.id)
+    _registered(hass, "sensor.bath_humidity", "humidity", bath.id)
+    _registered(hass, "sensor.bath_wall_temperature", "temperature", bath.id)
+    _registered(hass, "sensor.bath_co2", "carbon_dioxide", bath.id)
+    _registered(hass, "binary_sensor.bath_window", "window", bath.id)
+    _registered(hass, "sensor.kitchen_temperature", "temperature", kitchen.id)
+    _registered(hass, "sensor.kitchen_humidity", "humidity", kitchen.id)
+    _registered(hass, "sensor.office_temperature", "temperature", office.id)
+    _registered(hass, "sensor.office_humidity", "humidity", office.id)
+    _registered(hass, "sensor.outdoor_temperature", "temperature", balcony.id)
+    _registered(hass, "sensor.outdoor_humidity", "humidity", balcony.id)
+    entry = await setup_entry(
+        {
+            "id": "0",
+            CONF_ROOM_NAME: "Office",
+            CONF_AREA_ID: office.id,
+            CONF_FLOOR_AREA: 10.0,
+            CONF_CEILING_HEIGHT: 2.5,
+            CONF_INDOOR_TEMP: ["sensor.office_temperature"],
+            CONF_INDOOR_HUMIDITY: ["sensor.office_humidity"],
+            CONF_SURFACE_SENSORS: ["sensor.bath_wall_temperature"],
+        }
+    )
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {"next_step_id": "discover_rooms"})
+    assert result["step_id"] == "discover_rooms"
+    assert result["description_placeholders"]["count"] == "2"
+
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {"areas": [bath.id, kitchen.id]})
+    asked = []
+    while result["type"] is FlowResultType.FORM:
+        assert result["step_id"] == "discover_geometry"
+        asked.append(result["description_placeholders"]["name"])
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_FLOOR_AREA: 6.0, CONF_CEILING_HEIGHT: 2.4}
+        )
+
+    assert asked == ["Bath", "Kitchen"]
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    _office, new_bath, new_kitchen = result["data"][CONF_ROOMS]
+    assert new_bath[CONF_INDOOR_TEMP] == ["sensor.bath_temperature"]
+    assert new_bath[CONF_CO2_SENSOR] == "sensor.bath_co2"
+    assert new_bath[CONF_CONTACT_SENSORS] == ["binary_sensor.bath_window"]
+    assert new_bath[CONF_FLOOR_AREA] == 6.0
+    assert new_kitchen[CONF_INDOOR_HUMIDITY] == ["sensor.kitchen_humidity"]
+    assert len({"0", new_bath["id"], new_kitchen["id"]}) == 3
@@ -0,0 +1,84 @@
+"""Tests for the evaluation coordinator's handling of source sensors."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.calculations import calculate_absolute_humidity
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+
+SHELF = "sensor.bath_temperature"
+WINDOW = "sensor.bath_window_temperature"
+
+
+def _bath(*temperatures: str) -> dict:
+    return {
+        "id": "bath",
+        CONF_ROOM_NAME: "Bath",
+        CONF_FLOOR_AREA: 8.0,
+        CONF_CEILING_HEIGHT: 2.5,
+        CONF_INDOOR_TEMP: list(temperatures),
+        CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"],
+    }
+
+
+def _set(hass: HomeAssistant, entity_id: str, value: str, unit: str) -> None:
+    hass.states.async_set(entity_id, value, {ATTR_UNIT_OF_MEASUREMENT: unit})
+
+
+@pytest.mark.integration
+async def test_fahrenheit_source_is_converted(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """An indoor sensor in °F is read in °C."""
+    _set(hass, "sensor.outdoor_temperature", "5.0", UnitOfTemperature.CELSIUS)
+    _set(hass, "sensor.outdoor_humidity", "80", "%")
+    _set(hass, SHELF, "68.0", UnitOfTemperature.FAHRENHEIT)
+    _set(hass, "sensor.bath_humidity", "60", "%")
+    entry = await setup_entry(_bath(SHELF))
+    coordinator = entry.runtime_data.coordinator
+
+    assert coordinator.fusion["bath"][0].value == pytest.approx(20.0)
+    assert coordinator.results["bath"].indoor_ah == pytest.approx(calculate_absolute_humidity(20.0, 60), abs=0.01)
+
+
+@pytest.mark.integration
+async def test_unit_change_rebinds_the_source(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """A source switching its unit at runtime is converted with the new unit from then on."""
+    _set(hass, SHELF, "20.0", UnitOfTemperature.CELSIUS)
+    entry = await setup_entry(_bath(SHELF))
+    temperature = entry.runtime_data.coordinator.fusion["bath"][0]
+    assert temperature.value == pytest.approx(20.0)
+
+    _set(hass, SHELF, "295.15", UnitOfTemperature.KELVIN)
+    await hass.async_block_till_done()
+    assert temperature.value == pytest.approx(22.0)
+
+    _set(hass, SHELF, "73.4", UnitOfTemperature.FAHRENHEIT)
+    await hass.async_block_till_done()
+    assert temperature.value == pytest.approx(23.0)
+
+
+@pytest.mark.integration
+async def test_fused_room_with_mixed_units(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """Members in °C and °F are converted before they are averaged."""
+    _set(hass, SHELF, "20.0", UnitOfTemperature.CELSIUS)
+    _set(hass, WINDOW, "75.2", UnitOfTemperature.FAHRENHEIT)
+    entry = await setup_entry(_bath(SHELF, WINDOW))
+
+    assert entry.runtime_data.coordinator.fusion["bath"][0].value == pytest.approx(22.0)
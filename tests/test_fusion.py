@@ -0,0 +1,128 @@
+"""Tests for the weighted fusion of several sensors of one room."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+    CONF_SENSOR_WEIGHTS,
+    FUSION_STALE_AFTER,
+)
+from custom_components.ventilation_advisor.fusion import FusedSource, as_entity_list
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+NOW = 1_768_464_000.0  # 2026-01-15 08:00 UTC
+SHELF = "sensor.shelf_temperature"
+WINDOW = "sensor.window_temperature"
+RADIATOR = "sensor.radiator_temperature"
+
+
+def _fused(**readings: float) -> FusedSource:
+    """Return a shelf/window/radiator group weighted 2:1:1 with the given current readings."""
+    fused = FusedSource({SHELF: 2.0, WINDOW: 1.0, RADIATOR: 1.0})
+    for name, value in readings.items():
+        fused.update(f"sensor.{name}_temperature", value, NOW, NOW)
+    return fused
+
+
+@pytest.mark.unit
+def test_weighted_mean_uses_configured_weights() -> None:
+    """Members contribute in proportion to their weight."""
+    fused = _fused(shelf=20.0, window=18.0, radiator=24.0)
+
+    assert fused.value == pytest.approx((2 * 20.0 + 18.0 + 24.0) / 4, abs=0.01)
+
+
+@pytest.mark.unit
+def test_update_replaces_only_that_member() -> None:
+    """A new reading replaces the member's old contribution and keeps the others."""
+    fused = _fused(shelf=20.0, window=18.0, radiator=24.0)
+
+    fused.update(WINDOW, 14.0, NOW + 60, NOW + 60)
+    fused.update(WINDOW, 16.0, NOW + 120, NOW + 120)
+
+    assert fused.value == pytest.approx((2 * 20.0 + 16.0 + 24.0) / 4, abs=0.01)
+
+
+@pytest.mark.unit
+def test_stale_member_is_dropped_and_rejoins_on_update() -> None:
+    """A member silent for longer than the stale time is skipped until it reports again."""
+    fused = _fused(shelf=20.0, window=18.0)
+    later = NOW + FUSION_STALE_AFTER + 1
+    fused.update(SHELF, 21.0, later, later)
+
+    assert fused.stale_members(later) == [WINDOW]
+    # The coordinator re-checks the member's last report; an old one drops it.
+    fused.update(WINDOW, 18.0, NOW, later)
+    assert fused.stale_members(later) == []
+    assert fused.value == 21.0
+
+    fused.update(WINDOW, 15.0, later + 60, later + 60)
+    assert fused.value == pytest.approx((2 * 21.0 + 15.0) / 3, abs=0.01)
+
+
+@pytest.mark.unit
+def test_unavailable_member_is_excluded() -> None:
+    """An unavailable member is left out of the mean instead of counting as zero."""
+    fused = _fused(shelf=20.0, window=18.0, radiator=24.0)
+
+    fused.update(RADIATOR, None, NOW + 60, NOW + 60)
+    assert fused.value == pytest.approx((2 * 20.0 + 18.0) / 3, abs=0.01)
+
+    fused.update(SHELF, None, NOW + 60, NOW + 60)
+    fused.update(WINDOW, None, NOW + 60, NOW + 60)
+    assert fused.value is None
+
+
+@pytest.mark.unit
+def test_single_member_never_goes_stale() -> None:
+    """A room with one sensor keeps its value however old the last report is."""
+    fused = FusedSource({SHELF: 1.0})
+    fused.update(SHELF, 20.0, NOW, NOW + 3 * FUSION_STALE_AFTER)
+
+    assert fused.stale_members(NOW + 3 * FUSION_STALE_AFTER) == []
+    assert fused.value == 20.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("option", "expected"), [(None, []), (SHELF, [SHELF]), ([SHELF, WINDOW], [SHELF, WINDOW])])
+def test_as_entity_list(option: str | list[str] | None, expected: list[str]) -> None:
+    """Single-entity options from older versions are read as lists."""
+    assert as_entity_list(option) == expected
+
+
+@pytest.mark.integration
+async def test_coordinator_skips_unavailable_sensor(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """The room temperature follows the available sensors while one of them is unavailable."""
+    hass.states.async_set(SHELF, "20.0")
+    hass.states.async_set(WINDOW, "18.0")
+    entry = await setup_entry(
+        {
+            "id": "bath",
+            CONF_ROOM_NAME: "Bath",
+            CONF_FLOOR_AREA: 8.0,
+            CONF_CEILING_HEIGHT: 2.5,
+            CONF_INDOOR_TEMP: [SHELF, WINDOW],
+            CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"],
+            CONF_SENSOR_WEIGHTS: {SHELF: 3.0},
+        }
+    )
+    coordinator = entry.runtime_data.coordinator
+    temperature = coordinator.fusion["bath"][0]
+    assert temperature.value == pytest.approx((3 * 20.0 + 18.0) / 4, abs=0.01)
+
+    hass.states.async_set(WINDOW, STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    assert coordinator._fused_value(temperature, dt_util.utcnow().timestamp()) == 20.0  # noqa: SLF001
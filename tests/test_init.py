@@ -0,0 +1,52 @@
+"""Tests for the setup, reload and unload of the integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_CO2_SENSOR,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+)
+from homeassistant.core import HomeAssistant
+
+CO2 = "sensor.bath_co2"
+BATH = {
+    "id": "bath",
+    CONF_ROOM_NAME: "Bath",
+    CONF_FLOOR_AREA: 8.0,
+    CONF_CEILING_HEIGHT: 2.5,
+    CONF_INDOOR_TEMP: ["sensor.bath_temperature"],
+    CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"],
+    CONF_CO2_SENSOR: CO2,
+}
+
+
+@pytest.mark.integration
+async def test_learned_air_change_survives_reload(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]], freezer: FrozenDateTimeFactory
+) -> None:
+    """A rate learned just before a reload is saved on unload and restored by the new coordinator."""
+    entry = await setup_entry(BATH)
+    # One CO2 sample per minute: a decay at two air changes per hour, then a sustained rise.
+    levels = [420 + 1180 * 0.967**minute for minute in range(40)]
+    for ppm in [*levels, levels[-1] + 300, levels[-1] + 310, levels[-1] + 320]:
+        hass.states.async_set(CO2, f"{ppm:.0f}", {"unit_of_measurement": "ppm"})
+        freezer.tick(timedelta(minutes=1))
+    await hass.async_block_till_done()
+    learned = entry.runtime_data.coordinator.air_change["bath"].learned_ach
+    assert learned is not None
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.coordinator.air_change["bath"].learned_ach == learned
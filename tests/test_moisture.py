@@ -0,0 +1,97 @@
+"""Tests for the streaming moisture event detection."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.ventilation_advisor.const import (
+    MOISTURE_BASELINE_TAU,
+    MOISTURE_DRIFT,
+    MOISTURE_MAX_DURATION,
+    MOISTURE_THRESHOLD,
+)
+from custom_components.ventilation_advisor.moisture import EVENT_ENDED, EVENT_STARTED, MoistureEventDetector
+
+START = 1_768_464_000.0  # 2026-01-15 08:00 UTC
+VOLUME = 20.0
+
+
+def _settled(level: float = 8.0) -> tuple[MoistureEventDetector, float]:
+    """Return a detector that has seen a steady level for half an hour, and the time of its last sample."""
+    detector = MoistureEventDetector()
+    for minute in range(31):
+        assert detector.update(START + minute * 60, level, VOLUME) is None
+    return detector, START + 30 * 60
+
+
+def _alpha(seconds: float) -> float:
+    return 1 - math.exp(-seconds / MOISTURE_BASELINE_TAU)
+
+
+@pytest.mark.unit
+def test_shower_starts_and_ends_an_event() -> None:
+    """A sustained rise starts an event; falling back to the baseline ends it with the added water."""
+    detector, now = _settled()
+
+    transitions = [detector.update(now + minute * 60, 11.0, VOLUME) for minute in range(1, 4)]
+    assert transitions == [None, None, EVENT_STARTED]
+    assert detector.active
+    assert detector.started == now + 180
+    # The baseline is frozen while the event lasts.
+    baseline = detector.baseline
+    assert baseline == pytest.approx(8.0, abs=0.1)
+
+    assert detector.update(now + 240, 12.5, VOLUME) is None
+    assert detector.update(now + 600, 8.2, VOLUME) == EVENT_ENDED
+    assert not detector.active
+    assert detector.cusum == 0.0
+    assert detector.added_water == round((12.5 - baseline) * VOLUME, 0)
+    assert detector.baseline == baseline
+
+
+@pytest.mark.unit
+def test_event_ends_after_maximum_duration() -> None:
+    """An event that never falls back ends after the maximum duration and restarts the baseline."""
+    detector, now = _settled()
+    for minute in range(1, 4):
+        detector.update(now + minute * 60, 11.0, VOLUME)
+    assert detector.active
+
+    minute = 4
+    while detector.update(now + minute * 60, 11.0, VOLUME) is None:
+        minute += 1
+    assert (minute - 3) * 60 > MOISTURE_MAX_DURATION
+    assert detector.baseline == 11.0
+
+
+@pytest.mark.unit
+def test_excess_is_held_over_irregular_intervals() -> None:
+    """Each interval adds the excess held from its start, with long gaps capped."""
+    detector, now = _settled()
+
+    # A single high reading after a long gap adds nothing: the held excess is the steady level's.
+    assert detector.update(now + 600, 12.0, VOLUME) is None
+    assert detector.cusum == 0.0
+    baseline = 8.0 + _alpha(600) * 4.0
+    assert detector.baseline == pytest.approx(baseline)
+
+    # 30 s later the excess of that reading over the baseline it met is held over half a minute.
+    assert detector.update(now + 630, 12.0, VOLUME) is None
+    expected = (12.0 - 8.0 - MOISTURE_DRIFT) * 0.5
+    assert detector.cusum == pytest.approx(expected)
+    assert expected < MOISTURE_THRESHOLD
+
+    # A 15 minute gap counts as the 10 minute cap and pushes the sum over the threshold.
+    assert detector.update(now + 1530, 12.0, VOLUME) == EVENT_STARTED
+    assert detector.cusum == pytest.approx(expected + (12.0 - baseline - MOISTURE_DRIFT) * 10)
+
+
+@pytest.mark.unit
+def test_slow_drift_is_absorbed_by_the_baseline() -> None:
+    """A rise slower than the drift tolerance never starts an event."""
+    detector, now = _settled()
+    for minute in range(1, 360):
+        assert detector.update(now + minute * 60, 8.0 + minute / 360, VOLUME) is None
+    assert not detector.active
@@ -0,0 +1,127 @@
+"""Tests for the validation, import and export of room configurations."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_FLOOR_AREA,
+    CONF_HAS_SLOPE,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_MOULD_CRITICAL_OVERRIDE,
+    CONF_MOULD_SAFE_OVERRIDE,
+    CONF_ROOM_NAME,
+    CONF_ROOMS,
+    CONF_SENSOR_WEIGHTS,
+    CONF_STRATEGY,
+    DEFAULT_CEILING_HEIGHT,
+)
+from custom_components.ventilation_advisor.room_config import (
+    RoomImportError,
+    dump_rooms,
+    merge_rooms,
+    parse_rooms_document,
+    validate_rooms,
+)
+
+
+def _room(name: str, **extra: Any) -> dict[str, Any]:
+    slug = name.lower().replace(" ", "_")
+    return {
+        CONF_ROOM_NAME: name,
+        CONF_FLOOR_AREA: 12,
+        CONF_INDOOR_TEMP: f"sensor.{slug}_temperature",
+        CONF_INDOOR_HUMIDITY: f"sensor.{slug}_humidity",
+        **extra,
+    }
+
+
+@pytest.mark.unit
+def test_validate_rooms_applies_defaults_and_coerces() -> None:
+    """Valid rooms get schema defaults, numbers as floats and entity lists."""
+    (room,) = validate_rooms({CONF_ROOMS: [_room("Bath")]})
+
+    assert room[CONF_FLOOR_AREA] == 12.0
+    assert room[CONF_CEILING_HEIGHT] == DEFAULT_CEILING_HEIGHT
+    assert room[CONF_HAS_SLOPE] is False
+    assert room[CONF_INDOOR_TEMP] == ["sensor.bath_temperature"]
+
+
+@pytest.mark.unit
+def test_validate_rooms_reports_every_invalid_room() -> None:
+    """All problems of a document are reported together, labelled by room."""
+    rooms = [
+        _room("Bath"),
+        _room("Attic", **{CONF_HAS_SLOPE: True}),
+        _room("Cellar", **{CONF_MOULD_SAFE_OVERRIDE: 80, CONF_MOULD_CRITICAL_OVERRIDE: 70}),
+        _room("Office", **{CONF_SENSOR_WEIGHTS: {"sensor.other": 2}}),
+        _room("Bath"),
+        {CONF_ROOM_NAME: "Hall"},
+        "not a room",
+    ]
+
+    with pytest.raises(RoomImportError) as err:
+        validate_rooms(rooms)
+
+    message = str(err.value)
+    labels = ["rooms[1] (Attic)", "rooms[2] (Cellar)", "rooms[3] (Office)", "rooms[5] (Hall)", "rooms[6]:"]
+    assert all(label in message for label in labels)
+    assert "rooms[4] (Bath): duplicate room name" in message
+    assert "rooms[0]" not in message
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("document", [[], {}, {CONF_ROOMS: []}, "rooms"])
+def test_validate_rooms_rejects_empty_documents(document: Any) -> None:
+    """A document without rooms is rejected."""
+    with pytest.raises(RoomImportError):
+        validate_rooms(document)
+
+
+@pytest.mark.unit
+def test_merge_rooms_matches_by_name() -> None:
+    """Matched rooms keep their id, unmatched ones are kept and new ones get unused ids."""
+    existing = [{**_room("Bath"), "id": "0"}, {**_room("Kitchen"), "id": "2"}]
+    imported = validate_rooms([_room("Bath", **{CONF_FLOOR_AREA: 8}), _room("Attic")])
+
+    merged = merge_rooms(existing, imported)
+
+    assert [(room[CONF_ROOM_NAME], room["id"]) for room in merged] == [("Bath", "0"), ("Kitchen", "2"), ("Attic", "4")]
+    assert merged[0][CONF_FLOOR_AREA] == 8.0
+
+
+@pytest.mark.unit
+def test_merge_rooms_replace_drops_unmatched_rooms() -> None:
+    """With `replace`, existing rooms missing from the import are removed."""
+    existing = [{**_room("Bath"), "id": "0"}, {**_room("Kitchen"), "id": "1"}]
+
+    merged = merge_rooms(existing, validate_rooms([_room("Bath")]), replace=True)
+
+    assert [(room[CONF_ROOM_NAME], room["id"]) for room in merged] == [("Bath", "0")]
+
+
+@pytest.mark.unit
+def test_export_import_round_trip() -> None:
+    """An exported document imports back to the same rooms, without installation ids."""
+    rooms = [
+        {**room, "id": str(index)}
+        for index, room in enumerate(validate_rooms([_room("Bath", **{CONF_STRATEGY: "Aggressive"}), _room("Kitchen")]))
+    ]
+
+    document = dump_rooms(rooms)
+    imported = parse_rooms_document(document)
+
+    assert "id:" not in document
+    assert imported == [{key: value for key, value in room.items() if key != "id"} for room in rooms]
+    assert merge_rooms(rooms, imported, replace=True) == rooms
+
+
+@pytest.mark.unit
+def test_parse_rooms_document_rejects_invalid_yaml() -> None:
+    """A document that is not YAML or JSON raises a room import error."""
+    with pytest.raises(RoomImportError):
+        parse_rooms_document("rooms: [unclosed")
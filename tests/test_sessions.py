@@ -0,0 +1,126 @@
+"""Tests for the ventilation session tracking from contact sensors."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_CONTACT_SENSORS,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+    SESSION_LOG_SIZE,
+)
+from custom_components.ventilation_advisor.sessions import SessionTracker
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+START = datetime(2026, 1, 15, 8, 0, tzinfo=UTC)
+WINDOW = "binary_sensor.bath_window"
+DOOR = "binary_sensor.bath_door"
+
+
+def _at(minute: int) -> datetime:
+    return START + timedelta(minutes=minute)
+
+
+@pytest.mark.unit
+def test_open_and_close_make_one_session() -> None:
+    """Opening starts a session with the start snapshot; closing finishes it with the end snapshot."""
+    tracker = SessionTracker()
+
+    assert tracker.contact_changed(WINDOW, True, _at(0), (600.0, 1400.0, 21.0)) is False
+    assert tracker.current is not None
+    assert tracker.contact_changed(WINDOW, False, _at(10), (450.0, 700.0, 19.5)) is True
+
+    assert tracker.current is None
+    session = tracker.last
+    assert session is not None
+    assert (session.start, session.end) == (_at(0), _at(10))
+    assert session.duration == 10.0
+    assert session.water_removed == 150.0
+    assert session.temperature_drop == 1.5
+
+
+@pytest.mark.unit
+def test_session_lasts_until_the_last_contact_closes() -> None:
+    """Several contacts of one room form a single session from the first opening to the last closing."""
+    tracker = SessionTracker()
+    snapshot = (None, None, None)
+
+    tracker.contact_changed(WINDOW, True, _at(0), snapshot)
+    tracker.contact_changed(DOOR, True, _at(2), snapshot)
+    assert tracker.contact_changed(WINDOW, False, _at(5), snapshot) is False
+    assert tracker.contact_changed(DOOR, False, _at(8), snapshot) is True
+
+    assert len(tracker.log) == 1
+    assert tracker.log[0].start == _at(0)
+    assert tracker.log[0].end == _at(8)
+
+
+@pytest.mark.unit
+def test_seeded_contact_does_not_start_a_session() -> None:
+    """A contact seeded as open extends later sessions but does not start or finish one itself."""
+    tracker = SessionTracker()
+    snapshot = (None, None, None)
+
+    tracker.seed(WINDOW, True)
+    assert tracker.current is None
+    assert tracker.contact_changed(DOOR, True, _at(0), snapshot) is False
+    assert tracker.current is None
+
+    tracker.seed(WINDOW, False)
+    tracker.seed(DOOR, False)
+    assert tracker.contact_changed(WINDOW, True, _at(5), snapshot) is False
+    assert tracker.current is not None
+
+
+@pytest.mark.unit
+def test_session_log_is_bounded() -> None:
+    """Only the most recent sessions are kept."""
+    tracker = SessionTracker()
+    snapshot = (None, None, None)
+    for index in range(SESSION_LOG_SIZE + 5):
+        tracker.contact_changed(WINDOW, True, _at(2 * index), snapshot)
+        tracker.contact_changed(WINDOW, False, _at(2 * index + 1), snapshot)
+
+    assert len(tracker.log) == SESSION_LOG_SIZE
+    assert tracker.log[0].start == _at(10)
+
+
+@pytest.mark.integration
+async def test_restored_open_contact_does_not_start_a_session(
+    hass: HomeAssistant, setup_entry: Callable[..., Awaitable[MockConfigEntry]]
+) -> None:
+    """A contact that becomes known as open during boot is seeded instead of opening a session."""
+    hass.states.async_set(WINDOW, STATE_UNAVAILABLE)
+    entry = await setup_entry(
+        {
+            "id": "bath",
+            CONF_ROOM_NAME: "Bath",
+            CONF_FLOOR_AREA: 8.0,
+            CONF_CEILING_HEIGHT: 2.5,
+            CONF_INDOOR_TEMP: ["sensor.bath_temperature"],
+            CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"],
+            CONF_CONTACT_SENSORS: [WINDOW],
+        }
+    )
+    tracker = entry.runtime_data.coordinator.sessions["bath"]
+
+    hass.states.async_set(WINDOW, STATE_ON)
+    await hass.async_block_till_done()
+    assert tracker.current is None
+
+    hass.states.async_set(WINDOW, STATE_OFF)
+    await hass.async_block_till_done()
+    assert tracker.last is None
+
+    hass.states.async_set(WINDOW, STATE_ON)
+    await hass.async_block_till_done()
+    assert tracker.current is not None
@@ -0,0 +1,76 @@
+"""Tests for the downsampled statistics of high-frequency metrics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.ventilation_advisor.const import CONF_ROOM_NAME, DOMAIN
+from custom_components.ventilation_advisor.statistics import VentilationStatistics
+from homeassistant.core import HomeAssistant
+
+OUTDOOR_AH = f"{DOMAIN}:outdoor_ah"
+
+
+def _at(hour: int, minute: int) -> datetime:
+    return datetime(2026, 1, 15, hour, minute, tzinfo=UTC)
+
+
+def _publish(hass: HomeAssistant, statistics: VentilationStatistics, now: datetime) -> dict[str, list]:
+    with patch("custom_components.ventilation_advisor.statistics.async_add_external_statistics") as add:
+        statistics.async_publish(now)
+    return {metadata["statistic_id"]: stats for _hass, metadata, stats in (call.args for call in add.call_args_list)}
+
+
+@pytest.mark.unit
+async def test_sample_after_hour_boundary_closes_the_previous_hour(hass: HomeAssistant) -> None:
+    """A sample that crosses the hour closes the old period before it is added to the new one."""
+    hass.config.components.add("recorder")
+    statistics = VentilationStatistics(hass, {"bath": {CONF_ROOM_NAME: "Bath"}})
+
+    statistics.async_add_outdoor(10.0, _at(10, 50))
+    # Arrives after 11:00 but before the next publish tick.
+    statistics.async_add_outdoor(20.0, _at(11, 10))
+
+    (first,) = _publish(hass, statistics, _at(11, 15))[OUTDOOR_AH]
+    assert first["start"] == _at(10, 0)
+    assert first["mean"] == pytest.approx(10.0)
+    assert first["min"] == 10.0
+    assert first["max"] == 10.0
+
+    # The value held at 11:00 is carried into the new period until the next sample.
+    (second,) = _publish(hass, statistics, _at(12, 5))[OUTDOOR_AH]
+    assert second["start"] == _at(11, 0)
+    assert second["mean"] == pytest.approx((10.0 * 600 + 20.0 * 3000) / 3600)
+    assert second["min"] == 10.0
+    assert second["max"] == 20.0
+
+
+@pytest.mark.unit
+async def test_gap_over_several_hours_closes_every_period(hass: HomeAssistant) -> None:
+    """Every hour skipped by a sample gap is published with the last value carried over."""
+    hass.config.components.add("recorder")
+    statistics = VentilationStatistics(hass, {})
+
+    statistics.async_add_outdoor(8.0, _at(9, 30))
+    statistics.async_add_outdoor(9.0, _at(12, 30))
+
+    stats = _publish(hass, statistics, _at(12, 45))[OUTDOOR_AH]
+    assert [stat["start"] for stat in stats] == [_at(9, 0), _at(10, 0), _at(11, 0)]
+    assert all(stat["mean"] == pytest.approx(8.0) for stat in stats)
+
+
+@pytest.mark.unit
+async def test_metadata_declares_unit_class(hass: HomeAssistant) -> None:
+    """Absolute humidity statistics use the concentration converter's unit class."""
+    hass.config.components.add("recorder")
+    statistics = VentilationStatistics(hass, {})
+
+    with patch("custom_components.ventilation_advisor.statistics.async_add_external_statistics") as add:
+        statistics.async_add_outdoor(8.0, _at(9, 30))
+        statistics.async_publish(_at(10, 5))
+
+    metadata = add.call_args.args[1]
+    assert metadata["unit_class"] == "concentration"
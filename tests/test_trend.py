@@ -0,0 +1,69 @@
+"""Tests for the ring-buffer trend of a room quantity."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ventilation_advisor.const import TREND_CAPACITY, TREND_REBASE, TREND_WINDOW
+from custom_components.ventilation_advisor.trend import TrendBuffer
+
+START = 1_768_464_000.0  # 2026-01-15 08:00 UTC
+
+
+def _least_squares(samples: list[tuple[float, float]]) -> float:
+    n = len(samples)
+    mean_t = sum(t for t, _v in samples) / n
+    mean_v = sum(v for _t, v in samples) / n
+    covariance = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    return covariance / sum((t - mean_t) ** 2 for t, _v in samples)
+
+
+@pytest.mark.unit
+def test_slope_of_linear_rise() -> None:
+    """A steady rise is reported per hour once the window covers the minimum span."""
+    trend = TrendBuffer()
+    for minute in range(10):
+        trend.add(START + minute * 60, 8.0 + 0.05 * minute)
+    assert trend.slope is None
+
+    for minute in range(10, 30):
+        trend.add(START + minute * 60, 8.0 + 0.05 * minute)
+    assert trend.slope == pytest.approx(3.0)
+
+
+@pytest.mark.unit
+def test_ring_buffer_wraps_at_capacity() -> None:
+    """With more samples than fit, only the newest ones within the window are fitted."""
+    trend = TrendBuffer()
+    samples = [(START + second, 10.0 + ((second * 7919) % 13) / 10 + second / 1800) for second in range(0, 6000, 10)]
+    for timestamp, value in samples:
+        trend.add(timestamp, value)
+
+    kept = samples[-TREND_CAPACITY:]
+    assert kept[-1][0] - kept[0][0] < TREND_WINDOW
+    expected = _least_squares([((t - START) / 3600, v) for t, v in kept])
+    assert trend.slope == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.unit
+def test_window_drops_samples_older_than_an_hour() -> None:
+    """A change of direction shows once the old samples have left the window."""
+    trend = TrendBuffer()
+    for minute in range(120):
+        value = 10.0 + 0.02 * minute if minute < 60 else 11.2 - 0.01 * (minute - 60)
+        trend.add(START + minute * 60, value)
+
+    assert trend.slope == pytest.approx(-0.6)
+
+
+@pytest.mark.unit
+def test_rebase_keeps_the_slope() -> None:
+    """Moving the time origin after a day does not change the fitted slope."""
+    trend = TrendBuffer()
+    minutes = int(TREND_REBASE / 60) + 180
+    for minute in range(minutes):
+        trend.add(START + minute * 60, 10.0 + 0.5 * minute / 60)
+        if minute == int(TREND_REBASE / 60) + 1:
+            assert trend.slope == pytest.approx(0.5)
+
+    assert trend.slope == pytest.approx(0.5)
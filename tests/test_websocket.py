@@ -0,0 +1,78 @@
+"""Tests for the websocket subscription of room results."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.ventilation_advisor.const import (
+    CONF_CEILING_HEIGHT,
+    CONF_FLOOR_AREA,
+    CONF_INDOOR_HUMIDITY,
+    CONF_INDOOR_TEMP,
+    CONF_ROOM_NAME,
+    DOMAIN,
+)
+from homeassistant.core import HomeAssistant
+
+BATH = {
+    "id": "bath",
+    CONF_ROOM_NAME: "Bath",
+    CONF_FLOOR_AREA: 8.0,
+    CONF_CEILING_HEIGHT: 2.5,
+    CONF_INDOOR_TEMP: ["sensor.bath_temperature"],
+    CONF_INDOOR_HUMIDITY: ["sensor.bath_humidity"],
+}
+
+
+@pytest.mark.integration
+async def test_subscribe_sends_snapshot_deltas_and_close(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    setup_entry: Callable[..., Awaitable[MockConfigEntry]],
+) -> None:
+    """A subscriber gets every room, then changed rooms per pass, then a close message on unload."""
+    hass.states.async_set("sensor.outdoor_temperature", "5.0")
+    hass.states.async_set("sensor.outdoor_humidity", "80")
+    hass.states.async_set("sensor.bath_temperature", "21.0")
+    hass.states.async_set("sensor.bath_humidity", "60")
+    entry = await setup_entry(BATH)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe", "entry_id": entry.entry_id})
+    assert (await client.receive_json())["success"]
+    snapshot = (await client.receive_json())["event"]
+    assert snapshot["snapshot"] is True
+    assert snapshot["outdoor_ah"] is not None
+    assert snapshot["rooms"]["bath"]["name"] == "Bath"
+
+    hass.states.async_set("sensor.bath_humidity", "75")
+    await hass.async_block_till_done()
+    delta = (await client.receive_json())["event"]
+    assert "snapshot" not in delta
+    assert "outdoor_ah" not in delta
+    assert delta["rooms"]["bath"]["indoor_ah"] > snapshot["rooms"]["bath"]["indoor_ah"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert (await client.receive_json())["event"] == {"closed": True}
+
+
+@pytest.mark.integration
+async def test_subscribe_to_unknown_entry_fails(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    setup_entry: Callable[..., Awaitable[MockConfigEntry]],
+) -> None:
+    """An entry id that is not a loaded Ventilation Advisor entry is reported as not found."""
+    await setup_entry(BATH)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe", "entry_id": "missing"})
+    response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"